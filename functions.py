@@ -271,7 +271,7 @@ def process_push_transport_simple(
         )
 
         # LOG: Item leaves buffer
-        SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
+        helper_functions.add_to_eventlog_v3(
             case_id=item.caseID,
             object_id=item.ID,
             object_type=type(item).__name__,
@@ -328,7 +328,7 @@ def process_push_transport_simple(
             yield element.env.timeout(vehicle.load_time)
 
             # LOG: Loading
-            SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
+            helper_functions.add_to_eventlog_v3(
                 case_id=item.caseID,
                 object_id=item.ID,
                 object_type=type(item).__name__,
@@ -347,7 +347,7 @@ def process_push_transport_simple(
             item = yield vehicle.unload_item()
 
             # LOG: Unloading
-            SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
+            helper_functions.add_to_eventlog_v3(
                 case_id=item.caseID,
                 object_id=item.ID,
                 object_type=type(item).__name__,
@@ -365,7 +365,7 @@ def process_push_transport_simple(
             yield successor.entry.put(item)
 
             # LOG: Item received at successor
-            SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
+            helper_functions.add_to_eventlog_v3(
                 case_id=item.caseID,
                 object_id=item.ID,
                 object_type=type(item).__name__,
@@ -771,7 +771,7 @@ def process_transport(
 
                 # Handle special cases for dispatch logging
 
-                SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
+                helper_functions.add_to_eventlog_v3(
                     case_id=item.caseID,
                     object_id=item.ID,
                     object_type=type(item).__name__,
@@ -789,7 +789,7 @@ def process_transport(
                 items_loaded += 1
 
                 # LOG: LOADING OF COMPONENT
-                SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
+                helper_functions.add_to_eventlog_v3(
                     case_id=item.caseID,
                     object_id=item.ID,
                     object_type=type(item).__name__,
@@ -815,7 +815,7 @@ def process_transport(
                 item = yield vehicle.unload_item()
 
                 # LOG: UNLOADING OF COMPONENT
-                SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
+                helper_functions.add_to_eventlog_v3(
                     case_id=item.caseID,
                     object_id=item.ID,
                     object_type=type(item).__name__,
@@ -833,7 +833,7 @@ def process_transport(
                 yield element.entry.put(item)
 
                 # LOG: COMPONENT RECEIVED AT BUFFER
-                SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
+                helper_functions.add_to_eventlog_v3(
                     case_id=item.caseID,
                     object_id=item.ID,
                     object_type=type(item).__name__,
@@ -28,8 +28,12 @@ from src.g import SimulationConfig, SimulationBehavior
 
 # Global debug file handle
 _debug_file = None
+# True while the debug log is open; hot paths check it before building messages
+DEBUG = False
 # Global object registry
 _object_registry = {}
+# Parsed JSON config files, path -> (mtime, data), see load_json_cached()
+_json_cache = {}
 
 
 def init_debug_log():
@@ -60,7 +64,9 @@ def init_debug_log():
     debug_path = os.path.join(debug_output_path, debug_filename)
 
     # Open file for writing
+    global DEBUG
     _debug_file = open(debug_path, "w")
+    DEBUG = True
     _debug_file.write(f"Debug Log Started: {datetime.now()}\n")
     _debug_file.write(f"Experiment: {experiment_id}\n")
     _debug_file.write("=" * 80 + "\n\n")
@@ -92,7 +98,8 @@ def debug_print(message):
 
 def close_debug_log():
     """Close debug log file."""
-    global _debug_file
+    global _debug_file, DEBUG
+    DEBUG = False
     if _debug_file:
         _debug_file.write("\n" + "=" * 80 + "\n")
         _debug_file.write(f"Debug Log Ended: {datetime.now()}\n")
@@ -179,6 +186,32 @@ def is_working_hours(simulation: object) -> Tuple[bool, float, float]:
     )
 
 
+def load_json_cached(path: str) -> Union[Dict, List]:
+    """Load a JSON config file, parsing it only once as long as it is unchanged.
+
+    The parsed data is shared between all callers (validation, source and every
+    product of the variant), so callers that modify it must work on a copy.
+
+    Args:
+        path (str): path of the JSON file
+
+    Returns:
+        Union[Dict, List]: parsed content of the file
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    mtime = os.stat(path).st_mtime_ns
+    cached = _json_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, "r") as f:
+        data = json.load(f)
+    _json_cache[path] = (mtime, data)
+    return data
+
+
 def get_driving_time(
     start_location: str,
     end_location: str,
@@ -202,9 +235,6 @@ def get_driving_time(
     return driving_time
 
 
-# Replace count_parts in helper_functions.py temporarily with this debug version:
-
-
 def count_parts(component_group: Dict[str, Dict]) -> int:
     """counts the number of components and groups in a product structure or group structure,
     does not count the group itself,
@@ -218,30 +248,15 @@ def count_parts(component_group: Dict[str, Dict]) -> int:
     Returns:
         int: number of components and groups in the structure"""
 
-    components_list = []
-    groups_list = []
-    # Loop through all components and groups in the structure and check if they have a substructure
-    for (
-        key,
-        value,
-    ) in component_group.items():
-        try:
-            value["structure"]
-        # If there is no "structure" key, we know it's a component and add it to the components_list
-        except KeyError:
-            components_list.append({key: value})
-        # If there is a "structure" key, we know it's a group and add it to the groups_list
+    # Single pass without temporary lists so the loop stays cheap on CPython and
+    # is picked up by the PyPy JIT
+    count = 0
+    for value in component_group.values():
+        if "structure" in value:
+            # recursive call for the subgroup, plus 1 for the group itself
+            count += count_parts(value["structure"]) + 1
         else:
-            groups_list.append({key: value})
-
-    # count all components in this level of the structure
-    count = len(components_list)
-
-    for sub_group in groups_list:
-        for _, value in sub_group.items():
-            # recursive call for all subgroups in this level of the structure
-            count += count_parts(value["structure"])
-            # add 1 for the group itself
+            # component without substructure
             count += 1
 
     return count
@@ -408,9 +423,65 @@ def get_blocking_components(structure: Dict[str, Dict], target: str) -> List[str
     return blocking_components if blocking_components is not None else []
 
 
+def get_blocking_index(
+    structure: Dict[str, Dict],
+    present_components: set = None,
+    blocking_index: Dict[str, List[str]] = None,
+) -> Tuple[set, Dict[str, List[str]]]:
+    """Indexes all components of a structure and their blocking components in one pass.
+
+    The structure is walked in the same order as is_in_product and
+    get_blocking_components, so the index gives the same answers as calling
+    those functions for every component, without walking the structure each time.
+
+    Args:
+        structure (Dict[str, Dict]): structure of a product or group as stated in the json file
+        present_components (set, optional): set to collect component names. Defaults to None.
+        blocking_index (Dict[str, List[str]], optional): dict to collect blocking
+            components. Defaults to None.
+
+    Returns:
+        Tuple[set, Dict[str, List[str]]]: names of all components and groups in the
+            structure, and the blocking components of each component that has a
+            "blocked_by" entry (first occurrence wins)
+    """
+    if present_components is None:
+        present_components = set()
+    if blocking_index is None:
+        blocking_index = {}
+
+    for key, component in structure.items():
+        present_components.add(key)
+        if "blocked_by" in component and key not in blocking_index:
+            blocking_index[key] = component["blocked_by"]
+        if "structure" in component:
+            get_blocking_index(
+                component["structure"], present_components, blocking_index
+            )
+
+    return present_components, blocking_index
+
+
 # ==========================================
 # COMPONENTS BLOCKED BY FUNCTIONS
 # ==========================================
+def get_blocked_by_map(structure: Dict[str, Dict]) -> Dict[str, List[str]]:
+    """Build a reverse index of the blocking relations on one structure level.
+
+    Args:
+        structure (Dict[str, Dict]): structure of a product or group as stated in the json file
+
+    Returns:
+        Dict[str, List[str]]: maps each blocking component to the components on the
+            same level that list it in their "blocked_by" entry
+    """
+    blocked_by_map = {}
+    for key, value in structure.items():
+        for blocker in value.get("blocked_by", ()):
+            blocked_by_map.setdefault(blocker, []).append(key)
+    return blocked_by_map
+
+
 def find_components_blocked_by_recursive(
     structure: Dict[str, Dict], target: str, blocked_components: List[str]
 ) -> None:
@@ -521,12 +592,12 @@ def add_to_case_table(
     condition: float,
     target_components: Dict[str, int] = None,
     missing_components: List[str] = None,
-) -> pd.DataFrame:
+) -> None:
     """
-    Add a new row to the case table DataFrame.
+    Add a new row to the case table.
 
-    Returns:
-    pd.DataFrame: The updated DataFrame.
+    Rows are collected in SimulationConfig.case_table_list and converted to the
+    case_table DataFrame once at export, avoiding a DataFrame concat per product.
     """
 
     # Treat the timestamp as a delta in minutes
@@ -541,19 +612,16 @@ def add_to_case_table(
         json.dumps(missing_components) if missing_components else "[]"
     )
 
-    new_row = pd.DataFrame(
-        data=[
-            {
-                "caseID": caseID,
-                "product_type": product_type,
-                "delivery_time": delivery_time,
-                "condition": round(condition, 2),
-                "target_components": target_components_str,
-                "missing_components": missing_components_str,
-            }
-        ],
+    SimulationConfig.case_table_list.append(
+        {
+            "caseID": caseID,
+            "product_type": product_type,
+            "delivery_time": delivery_time,
+            "condition": round(condition, 2),
+            "target_components": target_components_str,
+            "missing_components": missing_components_str,
+        }
     )
-    return pd.concat([SimulationConfig.case_table, new_row], ignore_index=True)
 
 
 def add_to_output_table(
@@ -862,6 +930,81 @@ def calculate_time_components_simple(case_id, eventlog, simulation=None):
     return result
 
 
+def calculate_case_time_components(case_events, simulation=None):
+    """Calculate processing times from the formatted events of a single case.
+
+    Same result as calculate_time_components_simple() for the new event format,
+    but works on the event dicts of one case (SimulationConfig.events_by_case)
+    instead of filtering a DataFrame of the whole eventlog.
+    """
+    # Initialize result
+    result = {"station_times": {}, "vehicle_times": {}, "handling_time": 0.0}
+
+    # Initialize all stations with 0 if simulation provided
+    if simulation:
+        for station in simulation.stations:
+            result["station_times"][station.name] = 0.0
+        for vehicle in simulation.vehicles:
+            result["vehicle_times"][vehicle.name] = 0.0
+
+    # ISO 8601 timestamps of equal length sort chronologically as strings
+    disassembly_by_object = {}
+    transport_by_vehicle = {}
+    for event in sorted(case_events, key=lambda e: e["timestamp"]):
+        if event["activity"] == "disassembly":
+            disassembly_by_object.setdefault(event["object_id"], []).append(event)
+        elif event["activity"] == "transport":
+            transport_by_vehicle.setdefault(event["resource_id"], []).append(event)
+
+    def minutes_between(start, end):
+        return (
+            datetime.fromisoformat(end) - datetime.fromisoformat(start)
+        ).total_seconds() / 60
+
+    # Processing times (disassembly activities), matched per object
+    station_times = result["station_times"]
+    for obj_events in disassembly_by_object.values():
+        completes = [e for e in obj_events if e["activity_state"] == "complete"]
+        for start in obj_events:
+            if start["activity_state"] != "start":
+                continue
+            # Find matching complete
+            for complete in completes:
+                if (
+                    complete["resource_id"] == start["resource_id"]
+                    and complete["timestamp"] > start["timestamp"]
+                ):
+                    station = start["resource_id"]
+                    if station not in station_times:
+                        station_times[station] = 0
+                    station_times[station] += minutes_between(
+                        start["timestamp"], complete["timestamp"]
+                    )
+                    break
+
+    # Transport times, matched per vehicle
+    vehicle_times = result["vehicle_times"]
+    for vehicle, vehicle_events in transport_by_vehicle.items():
+        unloads = [e for e in vehicle_events if e["activity_state"] == "unload"]
+        for load in vehicle_events:
+            if load["activity_state"] != "load":
+                continue
+            # Find matching unload
+            for unload in unloads:
+                if (
+                    unload["object_id"] == load["object_id"]
+                    and unload["timestamp"] > load["timestamp"]
+                ):
+                    if vehicle not in vehicle_times:
+                        vehicle_times[vehicle] = 0
+                    vehicle_times[vehicle] += minutes_between(
+                        load["timestamp"], unload["timestamp"]
+                    )
+                    break
+
+    return result
+
+
 def update_log_disassembly_enhanced(
     product, time_components, runtime_config, simulation=None
 ):
@@ -953,7 +1096,9 @@ def add_to_eventlog_v3(
     """
     Add a new row to the eventlog with clean parameter names and OCEL 2.0 structure.
 
-    Migrated previous versions to new standard.
+    Migrated previous versions to new standard. Events are buffered as raw tuples
+    and only formatted (object ID, event ID, timestamp) when the buffer is flushed
+    into SimulationConfig.events_list, see flush_eventlog().
 
     Parameters:
     case_id (int): The case ID (product ID that entered the system)
@@ -967,6 +1112,52 @@ def add_to_eventlog_v3(
     related_objects (str): Related objects in format "object_id:relationship,..."
     """
     if SimulationConfig.export_eventlog:
+        buffer = SimulationConfig.eventlog_buffer
+        buffer.append(
+            (
+                case_id,
+                object_id,
+                object_type,
+                activity,
+                activity_state,
+                resource_id,
+                resource_location,
+                timestamp,
+                related_objects,
+            )
+        )
+        if len(buffer) >= SimulationConfig.eventlog_flush_threshold:
+            flush_eventlog()
+
+
+def flush_eventlog() -> None:
+    """
+    Format all buffered events and append them to SimulationConfig.events_list
+    and to the per-case lists in SimulationConfig.events_by_case.
+
+    Must be called before events_list is read. Event IDs are assigned in the order
+    the events were recorded, so the result is identical to formatting each event
+    immediately.
+    """
+    buffer = SimulationConfig.eventlog_buffer
+    if not buffer:
+        return
+
+    events_list = SimulationConfig.events_list
+    events_by_case = SimulationConfig.events_by_case
+    start_date = SimulationConfig.start_date
+
+    for (
+        case_id,
+        object_id,
+        object_type,
+        activity,
+        activity_state,
+        resource_id,
+        resource_location,
+        timestamp,
+        related_objects,
+    ) in buffer:
         # Format object_id based on type and content
         if isinstance(object_id, str) and "_" in object_id:
             # e.g. "1_HousingPart" - split and reformat
@@ -1018,11 +1209,9 @@ def add_to_eventlog_v3(
 
         # Rest of function...
         delta = timedelta(minutes=timestamp)
-        timestamp_str = (SimulationConfig.start_date + delta).strftime(
-            "%Y-%m-%dT%H:%M:%S"
-        )
+        timestamp_str = (start_date + delta).strftime("%Y-%m-%dT%H:%M:%S")
 
-        event_count = len(SimulationConfig.events_list) + 1
+        event_count = len(events_list) + 1
         event_id = f"e{event_count:06d}"
 
         event = {
@@ -1038,7 +1227,14 @@ def add_to_eventlog_v3(
             "related_objects": related_objects,
         }
 
-        SimulationConfig.events_list.append(event)
+        events_list.append(event)
+        case_events = events_by_case.get(case_id)
+        if case_events is None:
+            events_by_case[case_id] = [event]
+        else:
+            case_events.append(event)
+
+    buffer.clear()
 
 
 def register_object(object_id: str, object_info: dict) -> None:
@@ -1199,6 +1395,7 @@ def calculate_time_components_v2(case_id, eventlog, simulation=None):
 
 def create_object_lookup_table_from_eventlog() -> pd.DataFrame:
     """Create object lookup table from eventlog data."""
+    flush_eventlog()
     if SimulationConfig.eventlog.empty and not SimulationConfig.events_list:
         return pd.DataFrame()
 
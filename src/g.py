@@ -206,10 +206,16 @@ class SimulationConfig:
         station_part_count_log (pd.DataFrame): Station product count over time
         inventory_log (pd.DataFrame): Inventory levels over time
         eventlog (pd.DataFrame): Detailed event log
+        events_by_case (dict): Formatted events grouped by caseID
         case_table (pd.DataFrame): Case information table
+        case_table_list (list): Case rows collected during the run
         output_table (pd.DataFrame): Final output components table
+        output_table_list (list): Output rows collected during the run
     """
 
+    # Number of buffered raw events that triggers formatting into events_list
+    eventlog_flush_threshold = 4096
+
     # Product variant information
     target_components_by_variant = {}  # Dict[product_type, Dict[component, quantity]]
 
@@ -413,6 +419,7 @@ class SimulationConfig:
         cls.show_technical_performance = display_config.get(
             "show_technical_performance", False
         )
+        cls.show_routing_plans = display_config.get("show_routing_plans", True)
 
     @classmethod
     def _init_monitoring_settings(cls, config: Dict) -> None:
@@ -699,6 +706,8 @@ class SimulationConfig:
 
         # Main simulation logs
         cls.events_list = []  # Initialize the events list for the new event logging approach
+        cls.eventlog_buffer = []  # Raw events not yet formatted into events_list
+        cls.events_by_case = {}  # caseID -> formatted events of that case
 
         # Define the revised event log structure with component tracking
         cls.eventlog = pd.DataFrame(
@@ -715,10 +724,12 @@ class SimulationConfig:
             ]
         )
 
+        cls.case_table_list = []  # Case rows collected during the run
         cls.case_table = pd.DataFrame(
             columns=["caseID", "product_type", "delivery_time", "condition"]
         )
 
+        cls.output_table_list = []  # Output rows collected during the run
         cls.output_table = pd.DataFrame(
             columns=[
                 "caseID",
@@ -132,6 +132,7 @@ def log_vehicle_data(simulation_run):
     total_simulation_time = SimulationConfig.time_to_simulate
 
     # Get eventlog - handle both list and DataFrame formats
+    helper_functions.flush_eventlog()
     if hasattr(SimulationConfig, "events_list") and SimulationConfig.events_list:
         eventlog = pd.DataFrame(SimulationConfig.events_list)
     elif (
@@ -416,6 +417,29 @@ def plot_timeseries():
         print(f"Error generating time series plots: {e}")
 
 
+def _rows_to_dataframe(rows, columns=None):
+    """
+    Build a DataFrame from rows collected during the run.
+
+    Reproduces the column types of the former per-row pd.concat onto the empty
+    table: a column whose first value is a float becomes float64 (ints written
+    later appear as "1.0"), all other columns stay object (ints keep "1"). This
+    matters for conditions clamped to the ints 0/1.
+
+    Args:
+        rows (list): Row dicts in the order they were logged
+        columns (list, optional): Column order of the resulting DataFrame
+
+    Returns:
+        pd.DataFrame: The table, with the same CSV output as before
+    """
+    df = pd.DataFrame(rows, columns=columns, dtype=object)
+    for column in df.columns:
+        if isinstance(df[column].iat[0], float):
+            df[column] = df[column].astype(float)
+    return df
+
+
 ## 7. Export configuration update for logging.py
 def export_data_v2(df, filename, output_path=None):
     """
@@ -504,9 +528,22 @@ def export_to_csv_v2(run_number, prefix=None, output_path=None, simulation_run=N
     # CORE OUTPUTS (raw data)
     # ==========================================
 
+    # Convert collected case and output rows to their DataFrames
+    if SimulationConfig.case_table_list:
+        SimulationConfig.case_table = _rows_to_dataframe(
+            SimulationConfig.case_table_list
+        )
+
+    if SimulationConfig.output_table_list:
+        SimulationConfig.output_table = _rows_to_dataframe(
+            SimulationConfig.output_table_list,
+            columns=SimulationConfig.output_table.columns,
+        )
+
     # Export event log ONLY if enabled
     if SimulationConfig.export_eventlog:
         # Convert events list to DataFrame with NEW structure
+        helper_functions.flush_eventlog()
         if SimulationConfig.events_list:
             print(
                 f"Creating eventlog DataFrame from {len(SimulationConfig.events_list)} events"
@@ -52,11 +52,37 @@ class product:
         delivery_time (float): Time when the product entered the system
         condition (float): Condition value from 0 (worst) to 1 (best)
         parts_count (int): Total number of parts that can be disassembled
+        remaining_parts (int): Number of parts still left in the structure
         level_of_disassembly (float): Progress from 0 (none) to 1 (fully disassembled)
         transport_units (int): Transport capacity required by the product
         components_to_scan (list): Components whose disassembly hasn't been attempted
     """
 
+    # Products are created for every arrival, so attributes are fixed via slots
+    __slots__ = (
+        "numeric_id",
+        "caseID",
+        "parent",
+        "content",
+        "type",
+        "ID",
+        "variant",
+        "parent_type",
+        "parent_component",
+        "component",
+        "delivery_time",
+        "condition",
+        "parts_count",
+        "remaining_parts",
+        "level_of_disassembly",
+        "transport_units",
+        "components_to_scan",
+        "original_variant_components",
+        "original_direct_children",
+        "routing_plan",
+        "current_route_index",
+    )
+
     def __init__(self, env, ID, variant_path, simulation=None):
         # Store the numeric ID first, then create the string ID with variant
         self.numeric_id = ID  # Store numeric ID for groups/components to use
@@ -64,9 +90,9 @@ class product:
         self.parent = self
 
         # Deep copy of the variant data (prevents issues if running multiple runs)
-        # Prevents modifications from affecting other products
-        with open(variant_path) as f:
-            variant_data = json.load(f)["variant"]
+        # Prevents modifications from affecting other products and the parsed
+        # file shared through the JSON cache
+        variant_data = helper_functions.load_json_cached(variant_path)["variant"]
         self.content = copy.deepcopy(variant_data)
 
         self.type = self.content["type"]
@@ -97,6 +123,8 @@ class product:
             )
 
         self.parts_count = helper_functions.count_parts(self.content["structure"])
+        # Live counter, kept up to date when components are removed from the structure
+        self.remaining_parts = self.parts_count
         self.level_of_disassembly = 0
         self.transport_units = self.content["transport_units"]
         self.components_to_scan = helper_functions.list_components(
@@ -307,12 +335,16 @@ class group:
         self.condition = None  # is set in generator
         self.level_of_disassembly = 0
         self.parts_count = helper_functions.count_parts(self.content["structure"])
+        self.remaining_parts = self.parts_count
         self.components_to_scan = helper_functions.list_components(
             self.content["structure"]
         )
         # Store original DIRECT children for inspection missing component check
         self.original_direct_children = set(self.content["structure"].keys())
 
+    def advance_route(self):
+        """Groups have no routing plan, so there is no route to advance."""
+
 
 class component:
     """Represents individual components resulting from disassembly operations.
@@ -357,3 +389,6 @@ class component:
         self.component = comp_key
         # Set parent_component to the parent's component value
         self.parent_component = parent.component
+
+    def advance_route(self):
+        """Components have no routing plan, so there is no route to advance."""
@@ -185,6 +185,9 @@ class Simulation:
         print("Starting simulation execution...")
         self.env.run(until=SimulationConfig.time_to_simulate)
 
+        # Format any events still buffered by the event log
+        helper_functions.flush_eventlog()
+
         # Final calculation pass for all products
         self._calculate_all_product_times()
 
@@ -616,9 +619,11 @@ class Simulation:
         # Clear and rebuild ends_of_line list
         self.ends_of_line.clear()  # Clear any existing entries
 
-        # Identify end-of-line components
+        # Identify end-of-line components (flag cached on the element for the
+        # per-item checks in its processes)
         for component in self.stations + self.storages:
-            if component not in self.all_predecessors:
+            component.is_end_of_line = component not in self.all_predecessors
+            if component.is_end_of_line:
                 self.ends_of_line.append(component)
 
     def _setup_product_generators(self) -> None:
@@ -669,6 +674,7 @@ class Simulation:
         print("\nCalculating product processing times...")
 
         # Convert events list to DataFrame if needed
+        helper_functions.flush_eventlog()
         if SimulationConfig.events_list:
             eventlog_df = pd.DataFrame(SimulationConfig.events_list)
         else:
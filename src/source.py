@@ -18,6 +18,9 @@ Supports three delivery modes:
 3. mixed: Combination of scheduled and random deliveries
 """
 
+import heapq
+import itertools
+
 from src.g import *
 from src.product import *
 
@@ -39,6 +42,17 @@ class Source:
         product_generators (list): Active simulation processes for product generation.
     """
 
+    __slots__ = (
+        "env",
+        "productcount",
+        "successor",
+        "simulation",
+        "delivery_schedule",
+        "use_schedule",
+        "schedule_complete",
+        "product_generators",
+    )
+
     def __init__(
         self, env: simpy.Environment, successor: simpy.Store, simulation=None
     ) -> None:
@@ -81,24 +95,29 @@ class Source:
             self.delivery_schedule = schedule_data["delivery_schedule"]
 
             # Check for required fields
-            required_fields = ["entries"]
-            for field in required_fields:
-                if field not in self.delivery_schedule:
-                    print(f"Error: Missing '{field}' in delivery schedule")
-                    return False
-
-            # Validate entries
-            for i, entry in enumerate(self.delivery_schedule["entries"]):
-                required_entry_fields = ["delivery_time", "product_file"]
-                for field in required_entry_fields:
-                    if field not in entry:
-                        print(
-                            f"Error: Missing '{field}' in delivery schedule entry {i + 1}"
-                        )
-                        return False
+            if "entries" not in self.delivery_schedule:
+                print("Error: Missing 'entries' in delivery schedule")
+                return False
+
+            # Validate entries: single pass, only locate the offending entry on failure
+            required_entry_fields = {"delivery_time", "product_file"}
+            entries = self.delivery_schedule["entries"]
+            if not all(required_entry_fields <= entry.keys() for entry in entries):
+                for i, entry in enumerate(entries):
+                    for field in ("delivery_time", "product_file"):
+                        if field not in entry:
+                            print(
+                                f"Error: Missing '{field}' in delivery schedule entry {i + 1}"
+                            )
+                            return False
+
+            # Clamp fixed conditions to [0,1] once instead of on every product creation
+            for entry in entries:
+                if entry.get("condition") is not None:
+                    entry["condition"] = min(max(entry["condition"], 0), 1)
 
             # Sort entries by delivery time
-            self.delivery_schedule["entries"].sort(key=lambda x: x["delivery_time"])
+            entries.sort(key=lambda x: x["delivery_time"])
 
             self.use_schedule = True
             print(
@@ -129,6 +148,9 @@ class Source:
             return
 
         current_time = 0
+        product_dir = os.path.join(
+            SimulationConfig.file_path, SimulationConfig.product_range_path
+        )
 
         # ==========================================
         # PHASE 2: Process each scheduled delivery
@@ -146,11 +168,7 @@ class Source:
             # PHASE 3: Create product
             # ==========================================
             # Construct path to product variant file
-            variant_path = os.path.join(
-                SimulationConfig.file_path,
-                SimulationConfig.product_range_path,
-                entry["product_file"],
-            )
+            variant_path = os.path.join(product_dir, entry["product_file"])
 
             # Check if file exists
             if not os.path.exists(variant_path):
@@ -200,11 +218,17 @@ class Source:
 
         Args:
             variant_path: Path to the product variant JSON file.
-            condition: Optional fixed condition value to use instead of random generation.
+            condition: Optional fixed condition value in [0,1] to use instead of random
+                generation.
 
         Returns:
             product: The created product instance.
         """
+        # Bind frequently used helpers locally
+        debug = helper_functions.debug_print
+        add_event = helper_functions.add_to_eventlog_v3
+        now = self.env.now
+
         # Increment product count
         self.productcount += 1
 
@@ -214,23 +238,19 @@ class Source:
         )
 
         # Debug log product creation
-        helper_functions.debug_print(
+        debug(
             f"Created product {p.ID} type={p.type} condition={p.condition:.2f} parts={p.parts_count}"
         )
-        # Show routing plan (always print for verification)
+        # Show routing plan (printed unless disabled in display settings)
         if hasattr(p, "routing_plan") and p.routing_plan:
-            helper_functions.debug_print(
-                f"Product {p.ID} ({p.type}): Routing = {' -> '.join(p.routing_plan)}"
-            )
-            print(
-                f"  Product {p.ID} ({p.type}): Routing = {' -> '.join(p.routing_plan)}"
-            )
+            routing_str = " -> ".join(p.routing_plan)
+            debug(f"Product {p.ID} ({p.type}): Routing = {routing_str}")
+            if SimulationConfig.show_routing_plans:
+                print(f"  Product {p.ID} ({p.type}): Routing = {routing_str}")
 
         # Set condition if provided, otherwise it uses the default random generation
         if condition is not None:
-            p.condition = min(
-                max(condition, 0), 1
-            )  # Ensure condition is in [0,1] range
+            p.condition = condition  # Already clamped to [0,1] when loading the schedule
 
         # Get the pre-calculated target components (based on product config)
         target_components = SimulationConfig.target_components_by_variant.get(
@@ -238,22 +258,22 @@ class Source:
         )
 
         # DEBUG
-        helper_functions.debug_print(f"\nCreating product {p.ID} type {p.type}")
-        helper_functions.debug_print(
-            f"  Original target components: {target_components}"
-        )
+        debug(f"\nCreating product {p.ID} type {p.type}")
+        debug(f"  Original target components: {target_components}")
 
         # Remove missing components and get list of what was removed
         missing_components = helper_functions.remove_components(p.content["structure"])
+        if missing_components:
+            p.remaining_parts = helper_functions.count_parts(p.content["structure"])
 
         # DEBUG
-        helper_functions.debug_print(f"  Missing components: {missing_components}")
-        helper_functions.debug_print(
+        debug(f"  Missing components: {missing_components}")
+        debug(
             f"  Remaining: {list(helper_functions.list_components(p.content['structure']))}"
         )
 
         # LOG: OBJECT CREATION - Product is created
-        SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
+        add_event(
             case_id=p.caseID,
             object_id=p.ID,
             object_type="product",
@@ -261,7 +281,7 @@ class Source:
             activity_state="created",
             resource_id="source",
             resource_location="generator",
-            timestamp=self.env.now,
+            timestamp=now,
             related_objects=None,  # No parent - this is a new product
         )
 
@@ -269,7 +289,7 @@ class Source:
         self.successor.put(p)
 
         # LOG 2: SYSTEM ENTRY - Product enters the disassembly system
-        SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
+        add_event(
             case_id=p.caseID,
             object_id=p.ID,
             object_type="product",
@@ -277,12 +297,12 @@ class Source:
             activity_state="entry",
             resource_id="incoming_storage",
             resource_location="entry",
-            timestamp=self.env.now,
+            timestamp=now,
             related_objects=None,
         )
 
         # Add to case table
-        SimulationConfig.case_table = helper_functions.add_to_case_table(
+        helper_functions.add_to_case_table(
             p.caseID,
             p.type,
             p.delivery_time,
@@ -293,17 +313,17 @@ class Source:
 
         return p
 
-    def random_product_generator(
-        self, variant_information: dict, variant_path: str
-    ) -> None:
-        """Generate products randomly according to the variant configuration.
+    def random_product_generator(self, variants: list) -> None:
+        """Generate products randomly according to the variant configurations.
 
-        This method maintains the original random generation behavior but now respects the
-        delivery mode configuration.
+        All random variants share a single SimPy process. The next arrival time
+        of each variant is kept in a heap, so the process only wakes up for the
+        earliest pending delivery instead of running one process per variant.
 
         Args:
-            variant_information: Configuration for the product variant.
-            variant_path: Path to the product variant JSON file.
+            variants: List of (variant_information, variant_path) tuples, where
+                variant_information is the configuration of the product variant
+                and variant_path the path to the product variant JSON file.
 
         Yields:
             SimPy timeout events for waiting between product generations.
@@ -315,8 +335,6 @@ class Source:
         if delivery_mode == "scheduled":
             return
 
-        log_disassembly_list = []
-
         # If scheduled deliveries are enabled and random deliveries are disabled, exit
         if (
             self.use_schedule
@@ -326,13 +344,45 @@ class Source:
             print("Random deliveries disabled in schedule configuration")
             return
 
-        while True:
+        # Per-variant constants: lot size, resolved path and delivery cycle times
+        lot_sizes = []
+        variant_paths = []
+        cycle_times = []
+        for variant_information, variant_path in variants:
+            lot_sizes.append(variant_information["lot_size"])
+            variant_paths.append(
+                os.path.join(SimulationConfig.file_path, variant_path)
+            )
+            cycle_times.append(
+                (
+                    (7 * 24 * 60) / variant_information["volume_per_week_min"],
+                    (7 * 24 * 60) / variant_information["volume_per_week_mu"],
+                    (7 * 24 * 60) / variant_information["volume_per_week_max"],
+                )
+            )
+
+        # Next arrival per variant as (time, sequence, variant index, timeout).
+        # The sequence number grows with every push, so ties resolve in the order
+        # the arrivals were scheduled, like SimPy's event IDs. The timeout is
+        # created when the arrival is scheduled, so it fires at exactly the same
+        # time and queue position as with one process per variant.
+        sequence = itertools.count()
+        next_arrivals = [
+            (self.env.now, next(sequence), idx, None) for idx in range(len(variants))
+        ]
+
+        while next_arrivals:
+            _, _, idx, arrival = heapq.heappop(next_arrivals)
+
+            # Wait until next product is generated
+            if arrival is not None:
+                yield arrival
+
             # Generate lot_size products without waiting in between
-            for i in range(variant_information["lot_size"]):
+            log_disassembly_list = []
+            for i in range(lot_sizes[idx]):
                 # Create product
-                p = self.create_product(
-                    os.path.join(SimulationConfig.file_path, variant_path)
-                )
+                p = self.create_product(variant_paths[idx])
 
                 # Add to log_disassembly list
                 log_disassembly_list.append(
@@ -357,37 +407,47 @@ class Source:
                     ],
                     ignore_index=True,
                 )
-                log_disassembly_list = []  # Reset for next iteration
-
-            # Get appropriate delivery cycle time based on behavior mode
-            delivery_cycle_time_min = (7 * 24 * 60) / variant_information[
-                "volume_per_week_min"
-            ]
-            delivery_cycle_time_mu = (7 * 24 * 60) / variant_information[
-                "volume_per_week_mu"
-            ]
-            delivery_cycle_time_max = (7 * 24 * 60) / variant_information[
-                "volume_per_week_max"
-            ]
-
-            if SimulationConfig.behavior_mode == SimulationBehavior.DETERMINISTIC:
-                # Use mode value
-                random_delivery_cycle_time = delivery_cycle_time_mu
-            else:
-                # SEEDED -> Use random number generator with triangular distribution
-                random_delivery_cycle_time = -1
-                while random_delivery_cycle_time < 0:
-                    random_delivery_cycle_time = SimulationConfig.rng_supply.triangular(
-                        delivery_cycle_time_min,
-                        delivery_cycle_time_max,
-                        delivery_cycle_time_mu,
-                    )
 
-            # Wait until next product is generated
-            yield self.env.timeout(
-                random_delivery_cycle_time * variant_information["lot_size"]
+            random_delivery_cycle_time = self._next_cycle_time(*cycle_times[idx])
+            delay = random_delivery_cycle_time * lot_sizes[idx]
+            heapq.heappush(
+                next_arrivals,
+                (
+                    self.env.now + delay,
+                    next(sequence),
+                    idx,
+                    self.env.timeout(delay),
+                ),
             )
 
+    def _next_cycle_time(
+        self, cycle_time_min: float, cycle_time_mu: float, cycle_time_max: float
+    ) -> float:
+        """Draw the next delivery cycle time for a random product generator.
+
+        Draws are taken lazily from the shared supply RNG so that the sequence
+        of arrivals stays identical for a given seed, regardless of how many
+        variants are generating products in parallel.
+
+        Args:
+            cycle_time_min: Minimum delivery cycle time in minutes.
+            cycle_time_mu: Most likely delivery cycle time in minutes.
+            cycle_time_max: Maximum delivery cycle time in minutes.
+
+        Returns:
+            float: Non-negative delivery cycle time in minutes.
+        """
+        if SimulationConfig.behavior_mode == SimulationBehavior.DETERMINISTIC:
+            # Use mode value
+            return cycle_time_mu
+
+        # SEEDED -> Use random number generator with triangular distribution
+        triangular = SimulationConfig.rng_supply.triangular
+        cycle_time = -1
+        while cycle_time < 0:
+            cycle_time = triangular(cycle_time_min, cycle_time_max, cycle_time_mu)
+        return cycle_time
+
     def initialize_generators(self):
         """Initialize product generation processes based on delivery mode.
 
@@ -471,8 +531,20 @@ class Source:
                     f"Using all {len(product_files)} available product variants for random generation"
                 )
 
-            # Get variant overrides from config if present
-            variant_overrides = SimulationConfig.full_configuration.get("variant_overrides", {})
+            random_variants = []
+
+            # Get variant overrides from config if present, keyed by lowercase name
+            variant_overrides = {
+                key.lower(): overrides
+                for key, overrides in SimulationConfig.full_configuration.get(
+                    "variant_overrides", {}
+                ).items()
+            }
+            override_fields = (
+                "volume_per_week_min",
+                "volume_per_week_mu",
+                "volume_per_week_max",
+            )
 
             # Start random generators for each product file
             for product_path in product_files:
@@ -480,34 +552,32 @@ class Source:
                     print(f"Warning: Product file not found: {product_path}")
                     continue
 
-                # Load variant information
-                with open(product_path) as json_file:
-                    variant_info = json.load(json_file)["variant"]
+                # Load variant information (copy, the overrides below must not
+                # change the cached file content)
+                variant_info = dict(
+                    helper_functions.load_json_cached(product_path)["variant"]
+                )
 
                 # Get variant type/name from the loaded info
                 variant_type = variant_info.get("type", "")
 
-                # Apply variant-specific overrides if present
-                # Check both capitalized and lowercase variant names
-                for variant_key in [variant_type, variant_type.lower()]:
-                    if variant_key in variant_overrides:
-                        overrides = variant_overrides[variant_key]
-
-                        # Apply volume overrides if specified
-                        if "volume_per_week_min" in overrides:
-                            variant_info["volume_per_week_min"] = overrides["volume_per_week_min"]
-                        if "volume_per_week_mu" in overrides:
-                            variant_info["volume_per_week_mu"] = overrides["volume_per_week_mu"]
-                        if "volume_per_week_max" in overrides:
-                            variant_info["volume_per_week_max"] = overrides["volume_per_week_max"]
+                # Apply variant-specific volume overrides if present (case-insensitive)
+                overrides = variant_overrides.get(variant_type.lower())
+                if overrides:
+                    variant_info.update(
+                        {
+                            key: overrides[key]
+                            for key in override_fields
+                            if key in overrides
+                        }
+                    )
 
-                        break  # Only apply once
+                random_variants.append((variant_info, product_path))
 
-                # Start generator process for random deliveries
+            # Start one generator process for all random deliveries
+            if random_variants:
                 self.product_generators.append(
-                    self.env.process(
-                        self.random_product_generator(variant_info, product_path)
-                    )
+                    self.env.process(self.random_product_generator(random_variants))
                 )
 
             if not product_files:
@@ -20,6 +20,7 @@ Station states: IDLE, BUSY, BLOCKED, FAILED, CLOSED
 
 # Standard library imports
 from contextlib import ExitStack
+from typing import Set
 
 # Third-party imports
 import simpy
@@ -31,6 +32,43 @@ from src.station_state import StationState
 import functions
 import helper_functions
 
+# Suffixes of the inspection relationship by (mandatory, blocking) flags
+RELATIONSHIP_FLAG_SUFFIXES = {
+    (False, False): "",
+    (True, False): "_mandatory",
+    (False, True): "_blocking",
+    (True, True): "_mandatory_blocking",
+}
+
+
+def get_parent_id(product):
+    """Build the ID under which a product or group is logged as parent of its parts.
+
+    Args:
+        product: The product or group being disassembled
+
+    Returns:
+        str: Parent ID for the related_objects field of the event log
+    """
+    product_type_name = type(product).__name__
+    if product_type_name == "product":
+        # parent_id = f"prod_{product.ID:03d}"
+        return product.ID
+    if product_type_name == "group":
+        # For groups, ID is like "1_productname-groupname1"
+        # Cannot use :03d for formatting
+        if "_" in str(product.ID):
+            parts = str(product.ID).split("_", 1)
+            if parts[0].isdigit():
+                # Reformat with leading zeros
+                return f"group_{int(parts[0]):03d}_{parts[1]}"
+            # If format is unexpected, use as is
+            return f"group_{product.ID}"
+        # No underscore, try to format as number
+        return f"group_{product.ID}"
+    # Fallback
+    return f"obj_{product.ID}"
+
 
 def create_and_put_component_in_storage(
     station, product, comp_key, comp_properties, storage
@@ -50,19 +88,29 @@ def create_and_put_component_in_storage(
     Yields:
         Various SimPy events for timeouts and storage operations
     """
-    for i in range(comp_properties["quantity"]):
+    # Loop invariants bound once (env.now is read per unit as it advances with yields)
+    quantity = comp_properties["quantity"]
+    triangular = SimulationConfig.rng_components.triangular
+    update_log = helper_functions.update_log_disassembly
+    add_event = helper_functions.add_to_eventlog_v3
+    part_share = 1 / product.parts_count
+    related_parent = f"{product.ID}:parent"
+    # Only actual products (not groups) are tracked in log_disassembly
+    parent_is_product = type(product).__name__ == "product"
+
+    for i in range(quantity):
         c = component(product, comp_key, comp_properties)
-        if comp_properties["quantity"] > 1:
+        if quantity > 1:
             c.ID = f"{c.ID}_{i + 1}"
 
         # condition adjusted with rng value
-        c.condition = SimulationConfig.rng_components.triangular(0, 0.5, 1)
+        c.condition = triangular(0, 0.5, 1)
         c.parent_component = product.type  # Set parent component for tracking
-        product.level_of_disassembly += 1 / product.parts_count
+        product.level_of_disassembly += part_share
 
         # Update product disassembly information in log
-        if type(product).__name__ == "product":  # Only update for actual products
-            helper_functions.update_log_disassembly(
+        if parent_is_product:
+            update_log(
                 product,
                 "level_of_disassembly",
                 product.level_of_disassembly,
@@ -70,18 +118,16 @@ def create_and_put_component_in_storage(
             )
 
         # LOG: COMPONENT CREATED
-        parent_id = product.ID if type(product).__name__ == "product" else product.ID
-
-        SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
+        add_event(
             case_id=c.caseID,
             object_id=c.ID,
-            object_type=type(c).__name__,
+            object_type="component",
             activity="creation",
             activity_state="complete",
             resource_id=station.name,
             resource_location="workstation",
             timestamp=station.env.now,
-            related_objects=f"{parent_id}:parent",
+            related_objects=related_parent,
         )
 
         yield from put_component_in_output_storage(station, c, storage)
@@ -116,7 +162,7 @@ def put_component_in_output_storage(station, component_item, storage):
     station.state.enter_state(StationState.BUSY, f"Completed storing {c.ID}")
 
     # LOG ENTRY TO OUTGOING BUFFER
-    SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
+    helper_functions.add_to_eventlog_v3(
         case_id=c.caseID,
         object_id=c.ID,
         object_type=type(c).__name__,
@@ -144,6 +190,47 @@ def put_component_in_output_storage(station, component_item, storage):
     helper_functions.update_log_disassembly(c.parent, "done", True, "equate")
 
 
+def put_in_output_buffer(station, item, outbuf, location, order_pickup):
+    """Put a disassembled group or component in an output buffer of the station.
+
+    Args:
+        station: The station instance performing the operation
+        item: The group or component to put in the buffer
+        outbuf: The output buffer (outbuf_to_next or outbuf_to_store)
+        location: Name of the buffer for the event log and the ordering process
+        order_pickup: Whether the outgoing storage is ordered to pick up the item
+
+    Yields:
+        SimPy events for handling time and buffer operations
+    """
+    # Handling time for moving to the buffer
+    yield station.env.timeout(station.handling_time)
+    yield outbuf.put(item)
+
+    # LOG: COMPONENT ENTERS OUTGOING BUFFER
+    helper_functions.add_to_eventlog_v3(
+        case_id=item.caseID,
+        object_id=item.ID,
+        object_type=type(item).__name__,
+        activity="buffer",
+        activity_state="enter",
+        resource_id=station.name,
+        resource_location=location,
+        timestamp=station.env.now,
+        related_objects=None,  # Just moving to buffer, no parent tracking needed
+    )
+
+    # Order outgoing storage to pick up the item
+    if order_pickup:
+        station.env.process(
+            functions.ordering(
+                station.simulation.outgoing_storage,
+                station.simulation,
+                location,
+            )
+        )
+
+
 class Station:
     """Disassembly station where products are processed.
 
@@ -159,11 +246,12 @@ class Station:
         name (str): Station identifier
         predecessors (list): Previous stations in the process flow
         entry_capacity (int): Capacity of the entry storage
-        entry (simpy.FilterStore): Entry buffer for incoming items
-        workstation (simpy.FilterStore): Processing area
+        entry (simpy.Store): Entry buffer for incoming items
+        workstation (simpy.Store): Processing area
         outbuf_to_next (simpy.FilterStore): Exit buffer for items needing further disassembly
         outbuf_to_store (simpy.FilterStore): Exit buffer for completed items
         simulation (object): Reference to the main simulation instance
+        is_end_of_line (bool): Whether no other element orders from this station
         order_threshold (int): Entry inventory threshold for ordering
         state (StationState): State machine for tracking station states
         disassembly_time_station (float): Total disassembly time for current product
@@ -199,8 +287,14 @@ class Station:
         # NEW: Load variant routing configuration
         self.variant_routing = station_values.get("variant_routing", {})
         self.entry_capacity = station_values["entry_capacity"]
-        self.entry = simpy.FilterStore(env, self.entry_capacity)
-        self.workstation = simpy.FilterStore(env, capacity=float("inf"))
+        # Entry and workstation are only read with plain get(), so they use a
+        # Store; the exit buffers stay FilterStores for filtered transport pickup
+        self.entry = simpy.Store(env, self.entry_capacity)
+        # Items are added with put(). Finished items are removed from .items
+        # directly; the store is unbounded, so there is never a waiting put
+        # that a removal would have to trigger, and working() only calls get()
+        # when the store is not empty
+        self.workstation = simpy.Store(env, capacity=float("inf"))
         self.outbuf_to_next = simpy.FilterStore(
             env, capacity=station_values["outbuf_to_next_capacity"]
         )
@@ -208,6 +302,7 @@ class Station:
             env, capacity=station_values["outbuf_to_store_capacity"]
         )
         self.simulation = simulation
+        self.is_end_of_line = False  # set by Simulation._configure_network
         self.order_threshold = station_values["entry_order_threshold"]
 
         # Initialize state machine
@@ -224,6 +319,12 @@ class Station:
         self.step_equipment = [step[1] for step in steps]
         self.step_employees = [step[2] for step in steps]
         self.step_conditions = [step[3] for step in steps]
+        # Lookup structures for step membership and per-step values by step name
+        # (step names are the keys of the station's steps config, so they are unique)
+        self.step_names_set = set(self.step_names)
+        self.step_condition_by_name = dict(zip(self.step_names, self.step_conditions))
+        self.step_equipment_by_name = dict(zip(self.step_names, self.step_equipment))
+        self.step_employees_by_name = dict(zip(self.step_names, self.step_employees))
         self.step_time_start = 0
         self.step_time_done = 0
         self.open_orders = 0
@@ -302,19 +403,24 @@ class Station:
                         StationState.BUSY, "Getting item from workstation"
                     )
                     product = yield self.workstation.get()
+                    product_type_name = type(product).__name__
+                    # Track workstation membership so the product can later be removed
+                    # directly instead of via a filtered get (working() is the only consumer)
+                    product_in_workstation = False
 
-                    # DEBUG
-                    helper_functions.debug_print(
-                        f"\nProcessing from workstation: {product.ID} type={type(product).__name__}"
-                    )
-                    if hasattr(product, "content") and "structure" in product.content:
+                    # DEBUG (messages are only built while the debug log is open)
+                    if helper_functions.DEBUG:
                         helper_functions.debug_print(
-                            f"  Remaining components: {list(product.content['structure'].keys())}"
-                        )
-                    if hasattr(product, "components_to_scan"):
-                        helper_functions.debug_print(
-                            f"  Components to scan: {product.components_to_scan}"
+                            f"\nProcessing from workstation: {product.ID} type={product_type_name}"
                         )
+                        if hasattr(product, "content") and "structure" in product.content:
+                            helper_functions.debug_print(
+                                f"  Remaining components: {list(product.content['structure'].keys())}"
+                            )
+                        if hasattr(product, "components_to_scan"):
+                            helper_functions.debug_print(
+                                f"  Components to scan: {product.components_to_scan}"
+                            )
 
                 # Get an object from station entry (ordering process runs separately)
                 else:
@@ -324,6 +430,7 @@ class Station:
                     # Ordering process handles requesting items from predecessors
                     # This just waits for items to arrive in entry buffer
                     product = yield self.entry.get()
+                    product_type_name = type(product).__name__
 
                     # ==========================================
                     # PHASE 2: Handle incoming product
@@ -334,10 +441,10 @@ class Station:
                     )
 
                     # LOG: COMPONENTS LEAVES INCOMING BUFFER (product picked for processing at station)
-                    SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
+                    helper_functions.add_to_eventlog_v3(
                         case_id=product.caseID,
                         object_id=product.ID,
-                        object_type=type(product).__name__,
+                        object_type=product_type_name,
                         activity="buffer",
                         activity_state="exit",
                         resource_id=self.name,
@@ -349,12 +456,13 @@ class Station:
                     # Put product in self.workstation
                     yield self.env.timeout(self.handling_time)
                     yield self.workstation.put(product)
+                    product_in_workstation = True
 
                     # LOG: COMPONENT ENTERS STATION (= start handling component)
-                    SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
+                    helper_functions.add_to_eventlog_v3(
                         case_id=product.caseID,
                         object_id=product.ID,
-                        object_type=type(product).__name__,
+                        object_type=product_type_name,
                         activity="handling",
                         activity_state="start",
                         resource_id=self.name,
@@ -371,6 +479,7 @@ class Station:
                 # ==========================================
                 # Reset disassembly_time for this product
                 self.disassembly_time_station = 0
+                is_actual_product = product_type_name == "product"
 
                 # Scan and disassemble - method handles its own state transitions
                 yield from self.scan_for_target_components(
@@ -381,9 +490,7 @@ class Station:
                 self.productcount += 1
 
                 # Update product disassembly information in log
-                if (
-                    type(product).__name__ == "product"
-                ):  # Only update for actual products
+                if is_actual_product:  # Only update for actual products
                     helper_functions.update_log_disassembly(
                         product,
                         "level_of_disassembly",
@@ -394,25 +501,25 @@ class Station:
                 # ==========================================
                 # PHASE 5: Determine product destination/next steps based on remaining parts
                 # ==========================================
-                # Count remaining parts
-                parts_count = helper_functions.count_parts(product.content["structure"])
+                # Remaining parts are tracked on the product as components are removed
+                parts_count = product.remaining_parts
 
                 # HANDLE DIFFERENT CASES BASED ON PARTS COUNT
                 if parts_count == 1:
                     # ==========================================
                     # CASE A: Single component left
                     # ==========================================
-                    comp_key = list(product.content["structure"].keys())[0]
-                    comp_properties = product.content["structure"][comp_key]
+                    comp_key, comp_properties = next(
+                        iter(product.content["structure"].items())
+                    )
 
                     yield from create_and_put_component_in_storage(
                         self, product, comp_key, comp_properties, self.outbuf_to_store
                     )
 
                     # Remove product from workstation if it still exists there
-                    if product in self.workstation.items:
-                        yield self.workstation.get(lambda x: x == product)
-                    del product
+                    if product_in_workstation:
+                        self.workstation.items.remove(product)
 
                 elif parts_count == 0:
                     # ==========================================
@@ -427,9 +534,8 @@ class Station:
                     )
 
                     # Remove product from workstation if it still exists there
-                    if product in self.workstation.items:
-                        yield self.workstation.get(lambda x: x == product)
-                    del product
+                    if product_in_workstation:
+                        self.workstation.items.remove(product)
 
                 else:
                     # ==========================================
@@ -442,70 +548,78 @@ class Station:
 
                     # Check if group contains elements that are in step_names
                     group_done = True
-                    for key, element in product.content["structure"].items():
-                        if key in self.step_names and key in product.components_to_scan:
-                            # Check if this component can actually be processed
-                            # (not just in components_to_scan but also meets condition requirements)
-                            component_condition = product.condition + element.get(
-                                "condition_dev_mu", 0
-                            )
-                            component_condition = min(max(component_condition, 0), 1)
-                            min_condition = self.step_conditions[
-                                self.step_names.index(key)
-                            ]
-
-                            # Only put back if it's mandatory OR meets condition requirements
+                    blocked_by_map = None  # Built on first low-quality component
+                    # Only components still in components_to_scan can keep the group
+                    # here, so the structure is not walked once the scan list is empty
+                    if product.components_to_scan:
+                        for key, element in product.content["structure"].items():
                             if (
-                                element.get("mandatory", False)
-                                or component_condition >= min_condition
+                                key in self.step_names_set
+                                and key in product.components_to_scan
                             ):
-                                # If so, put group back in workstation for further disassembly
-                                group_done = False
+                                # Check if this component can actually be processed
+                                # (not just in components_to_scan but also meets condition requirements)
+                                component_condition = product.condition + element.get(
+                                    "condition_dev_mu", 0
+                                )
+                                component_condition = min(max(component_condition, 0), 1)
+                                min_condition = self.step_condition_by_name[key]
 
-                                # Remove product from workstation to make sure it only exists once
-                                if product in self.workstation.items:
-                                    yield self.workstation.get(lambda x: x == product)
+                                # Only put back if it's mandatory OR meets condition requirements
+                                if (
+                                    element.get("mandatory", False)
+                                    or component_condition >= min_condition
+                                ):
+                                    # If so, put group back in workstation for further disassembly
+                                    group_done = False
 
-                                # DEBUG
-                                helper_functions.debug_print(
-                                    f"  Putting {product.ID} BACK in workstation for more processing"
-                                )
+                                    # Remove product from workstation to make sure it only exists once
+                                    if product_in_workstation:
+                                        self.workstation.items.remove(product)
 
-                                # Put product back in workstation
-                                yield self.workstation.put(product)
+                                    # DEBUG
+                                    if helper_functions.DEBUG:
+                                        helper_functions.debug_print(
+                                            f"  Putting {product.ID} BACK in workstation for more processing"
+                                        )
 
-                                # Transition back to BUSY
-                                self.state.enter_state(
-                                    StationState.BUSY,
-                                    "Product requires more processing",
-                                )
-                                break
-                            else:
-                                # Component can't be processed due to condition
-                                # BUT: Only remove if it doesn't block other components in scan list
-                                blocks_scanned_component = False
-                                for other_key, other_element in product.content[
-                                    "structure"
-                                ].items():
-                                    if (
-                                        other_key in product.components_to_scan
-                                        and key in other_element.get("blocked_by", [])
-                                    ):
-                                        blocks_scanned_component = True
-                                        break
+                                    # Put product back in workstation
+                                    yield self.workstation.put(product)
 
-                                if blocks_scanned_component:
-                                    # Keep in scan list - must be processed to unblock path
-                                    helper_functions.debug_print(
-                                        f"  {key} has low quality but blocks other components - keeping in scan list"
+                                    # Transition back to BUSY
+                                    self.state.enter_state(
+                                        StationState.BUSY,
+                                        "Product requires more processing",
                                     )
-                                elif key in product.components_to_scan:
-                                    # Safe to remove - doesn't block anything important
-                                    product.components_to_scan.remove(key)
-                                    helper_functions.debug_print(
-                                        f"  Removed {key} from components_to_scan - condition too low"
+                                    break
+                                else:
+                                    # Component can't be processed due to condition
+                                    # BUT: Only remove if it doesn't block other components in scan list
+                                    if blocked_by_map is None:
+                                        blocked_by_map = (
+                                            helper_functions.get_blocked_by_map(
+                                                product.content["structure"]
+                                            )
+                                        )
+                                    blocks_scanned_component = any(
+                                        other_key in product.components_to_scan
+                                        for other_key in blocked_by_map.get(key, ())
                                     )
 
+                                    if blocks_scanned_component:
+                                        # Keep in scan list - must be processed to unblock path
+                                        if helper_functions.DEBUG:
+                                            helper_functions.debug_print(
+                                                f"  {key} has low quality but blocks other components - keeping in scan list"
+                                            )
+                                    elif key in product.components_to_scan:
+                                        # Safe to remove - doesn't block anything important
+                                        product.components_to_scan.remove(key)
+                                        if helper_functions.DEBUG:
+                                            helper_functions.debug_print(
+                                                f"  Removed {key} from components_to_scan - condition too low"
+                                            )
+
                     if group_done:
                         # ==========================================
                         # CASE C1: Group finished at this station
@@ -519,25 +633,27 @@ class Station:
                         if len(product.components_to_scan) == 0:
                             # No components left to scan - product is done
                             should_send_to_storage = True
-                        elif self in self.simulation.ends_of_line:
+                        elif self.is_end_of_line:
                             # End-of-line station: check if THIS station can make progress
                             # (prevents infinite loop when remaining components can't be processed)
                             can_process_remaining = False
+                            # Index the structure once instead of walking it per component
+                            present_components, blocking_index = (
+                                helper_functions.get_blocking_index(
+                                    product.content["structure"]
+                                )
+                            )
+                            components_to_scan = set(product.components_to_scan)
                             for component in product.components_to_scan:
                                 if (
-                                    component in self.step_names
-                                    and helper_functions.is_in_product(
-                                        product.content["structure"], component
-                                    )
+                                    component in self.step_names_set
+                                    and component in present_components
                                 ):
                                     # Check if it's blocked by components that can't be removed
-                                    blocking = helper_functions.get_blocking_components(
-                                        product.content["structure"], component
-                                    )
+                                    blocking = blocking_index.get(component, [])
                                     # Can process if: no blockers OR all blockers are also in components_to_scan
                                     if not blocking or all(
-                                        b in product.components_to_scan
-                                        for b in blocking
+                                        b in components_to_scan for b in blocking
                                     ):
                                         can_process_remaining = True
                                         break
@@ -551,18 +667,16 @@ class Station:
                             # CASE C1a: All components checked OR no more progress possible - send to final storage
                             # ==========================================
                             # LOG: END OF HANDLING (Leaves workstation)
-                            SimulationConfig.eventlog = (
-                                helper_functions.add_to_eventlog_v3(
-                                    case_id=product.caseID,
-                                    object_id=product.ID,
-                                    object_type=type(product).__name__,
-                                    activity="handling",
-                                    activity_state="end",
-                                    resource_id=self.name,
-                                    resource_location="workstation",
-                                    timestamp=self.env.now,
-                                    related_objects=None,  # Product itself released
-                                )
+                            helper_functions.add_to_eventlog_v3(
+                                case_id=product.caseID,
+                                object_id=product.ID,
+                                object_type=product_type_name,
+                                activity="handling",
+                                activity_state="end",
+                                resource_id=self.name,
+                                resource_location="workstation",
+                                timestamp=self.env.now,
+                                related_objects=None,  # Product itself released
                             )
 
                             # If all components have been checked, put product in outbuf_to_store
@@ -570,7 +684,7 @@ class Station:
                             yield self.outbuf_to_store.put(product)
 
                             # DEBUG
-                            if self.name == "ws-01_fluids_01":
+                            if helper_functions.DEBUG and self.name == "ws-01_fluids_01":
                                 variant = getattr(product, "variant", product.type)
                                 helper_functions.debug_print(
                                     f"ws-01: Put {product.ID} ({variant}) in outbuf_to_store at {self.env.now}"
@@ -582,10 +696,10 @@ class Station:
                             )
 
                             # LOG: COMPONENTS ENTERS OUTGOING BUFFER (MOVED TO FINAL STORAGE)
-                            SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
+                            helper_functions.add_to_eventlog_v3(
                                 case_id=product.caseID,
                                 object_id=product.ID,
-                                object_type=type(product).__name__,
+                                object_type=product_type_name,
                                 activity="buffer",
                                 activity_state="enter",
                                 resource_id=self.name,
@@ -604,8 +718,8 @@ class Station:
                             )
 
                             # Remove product from workstation if it still exists there
-                            if product in self.workstation.items:
-                                yield self.workstation.get(lambda x: x == product)
+                            if product_in_workstation:
+                                self.workstation.items.remove(product)
 
                         # If not all components have been checked, put product in outbuf_to_next
                         else:
@@ -613,31 +727,28 @@ class Station:
                             # CASE C1b: More components to check - send downstream
                             # ==========================================
                             # LOG: PRODUCT LEAVES STATION (= End of handling)
-                            SimulationConfig.eventlog = (
-                                helper_functions.add_to_eventlog_v3(
-                                    case_id=product.caseID,
-                                    object_id=product.ID,
-                                    object_type=type(product).__name__,
-                                    activity="handling",
-                                    activity_state="end",
-                                    resource_id=self.name,
-                                    resource_location="workstation",
-                                    timestamp=self.env.now,
-                                    related_objects=None,  # Product itself released
-                                )
+                            helper_functions.add_to_eventlog_v3(
+                                case_id=product.caseID,
+                                object_id=product.ID,
+                                object_type=product_type_name,
+                                activity="handling",
+                                activity_state="end",
+                                resource_id=self.name,
+                                resource_location="workstation",
+                                timestamp=self.env.now,
+                                related_objects=None,  # Product itself released
                             )
 
                             # Put product in outbuf_to_next for further disassembly
                             yield self.env.timeout(self.handling_time)
 
                             # Advance routing plan to next station
-                            if hasattr(product, "advance_route"):
-                                product.advance_route()
+                            product.advance_route()
 
                             yield self.outbuf_to_next.put(product)
 
                             # DEBUG
-                            if self.name == "ws-01_fluids_01":
+                            if helper_functions.DEBUG and self.name == "ws-01_fluids_01":
                                 variant = getattr(product, "variant", product.type)
                                 helper_functions.debug_print(
                                     f"ws-01: Put {product.ID} ({variant}) in outbuf_to_next at {self.env.now} | "
@@ -650,22 +761,20 @@ class Station:
                             )
 
                             # LOG: PRODUCT ENTERS OUTGOING BUFFER (Moves to next disassembly step)
-                            SimulationConfig.eventlog = (
-                                helper_functions.add_to_eventlog_v3(
-                                    case_id=product.caseID,
-                                    object_id=product.ID,
-                                    object_type=type(product).__name__,
-                                    activity="buffer",
-                                    activity_state="enter",
-                                    resource_id=self.name,
-                                    resource_location="outbuf_to_next",
-                                    timestamp=self.env.now,
-                                    related_objects=None,  # Product itself released
-                                )
+                            helper_functions.add_to_eventlog_v3(
+                                case_id=product.caseID,
+                                object_id=product.ID,
+                                object_type=product_type_name,
+                                activity="buffer",
+                                activity_state="enter",
+                                resource_id=self.name,
+                                resource_location="outbuf_to_next",
+                                timestamp=self.env.now,
+                                related_objects=None,  # Product itself released
                             )
 
                             # Order outbuf_to_next to pick up component if end of line
-                            if self in self.simulation.ends_of_line:
+                            if self.is_end_of_line:
                                 self.env.process(
                                     functions.ordering(
                                         self.simulation.outgoing_storage,
@@ -675,11 +784,11 @@ class Station:
                                 )
 
                             # Remove product from workstation if it still exists there
-                            if product in self.workstation.items:
-                                yield self.workstation.get(lambda x: x == product)
+                            if product_in_workstation:
+                                self.workstation.items.remove(product)
 
                             # Mark product as done in log_disassembly if this station is end of line
-                            if self in self.simulation.ends_of_line:
+                            if self.is_end_of_line:
                                 helper_functions.update_log_disassembly(
                                     product, "done", True, "equate"
                                 )
@@ -701,24 +810,28 @@ class Station:
 
         # Safety check: if components_to_scan is empty, skip scanning (handle infinite loop)
         if not hasattr(object, "components_to_scan") or not object.components_to_scan:
-            helper_functions.debug_print(
-                f"No components to scan for product {object.ID}"
-            )
+            if helper_functions.DEBUG:
+                helper_functions.debug_print(
+                    f"No components to scan for product {object.ID}"
+                )
             return
 
         # Debug log scanning start
-        helper_functions.debug_print(
-            f"Station {self.name} scanning product {object.ID} type={object.type}"
-        )
+        if helper_functions.DEBUG:
+            helper_functions.debug_print(
+                f"Station {self.name} scanning product {object.ID} type={object.type}"
+            )
 
         # Start with BUSY state for scanning
         self.state.enter_state(StationState.BUSY, f"Scanning product {object.ID}")
+        object_type_name = type(object).__name__
+        add_event = helper_functions.add_to_eventlog_v3
 
         # LOG: START IDENTIFYING COMPONENTS THAT SHOULD BE DISASSEMBLED
-        SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
+        add_event(
             case_id=object.caseID,
             object_id=object.ID,
-            object_type=type(object).__name__,
+            object_type=object_type_name,
             activity="inspection",
             activity_state="start",
             resource_id=self.name,
@@ -729,17 +842,21 @@ class Station:
 
         # Initialize method variables
         self.disassembly_time_station = 0
-        self.steps_todo = []  # initialize list for steps this station has do to
+        # steps this station has to do, as an insertion-ordered dict used as an ordered set
+        self.steps_todo = {}
         self.steps_done = []  # initialize list for steps done
+        # Reverse index of the blocking relations on this level (for logging flags)
+        blocked_by_map = helper_functions.get_blocked_by_map(structure)
 
         # add all components and groups that are in steps and whose disassembly has not yet been attempted to steps_todo
         for key, element in structure.items():
-            if key in self.step_names and key in object.components_to_scan:
+            if key in self.step_names_set and key in object.components_to_scan:
                 # ALWAYS add to steps_todo (mandatory components must be disassembled regardless of quality)
-                self.steps_todo.append(key)
-                helper_functions.debug_print(
-                    f"  Station {self.name} can process component {key}"
-                )
+                self.steps_todo[key] = None
+                if helper_functions.DEBUG:
+                    helper_functions.debug_print(
+                        f"  Station {self.name} can process component {key}"
+                    )
 
                 # LOG: LIST COMPONENTS THAT SHOULD BE DISASSEMBLED (including quantity and quality info)
                 # Get quantity
@@ -760,8 +877,7 @@ class Station:
                 component_condition = min(max(component_condition, 0), 1)
 
                 # Get minimum required condition for this component
-                step_index = self.step_names.index(key)
-                min_condition = self.step_conditions[step_index]
+                min_condition = self.step_condition_by_name[key]
 
                 # Determine relationship based on quality and quantity (for logging only)
                 if component_condition < min_condition:
@@ -775,37 +891,16 @@ class Station:
                 else:
                     identified_relationship = "identified"
 
-                # Add blocking/mandatory flags to the relationship
-                flags = []
-                if element.get("mandatory", False):
-                    flags.append("mandatory")
-
-                # Check if this component is blocking any other components
-                if "blocked_by" in element or any(
-                    key in comp.get("blocked_by", [])
-                    for comp in structure.values()
-                    if isinstance(comp, dict)
-                ):
-                    # This component either has blockers OR blocks something else
-                    # Check if it blocks something
-                    blocks_others = any(
-                        key in comp.get("blocked_by", [])
-                        for comp in structure.values()
-                        if isinstance(comp, dict)
-                    )
-                    if blocks_others:
-                        flags.append("blocking")
-
-                # Append flags to relationship if any
-                if flags:
-                    identified_relationship = (
-                        f"{identified_relationship}_{'_'.join(flags)}"
-                    )
+                # Add mandatory flag and blocking flag (component blocks any other
+                # components) to the relationship
+                identified_relationship += RELATIONSHIP_FLAG_SUFFIXES[
+                    (bool(element.get("mandatory", False)), key in blocked_by_map)
+                ]
 
-                SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
+                add_event(
                     case_id=object.caseID,
                     object_id=object.ID,
-                    object_type=type(object).__name__,
+                    object_type=object_type_name,
                     activity="inspection",
                     activity_state="complete",
                     resource_id=self.name,
@@ -815,8 +910,6 @@ class Station:
                 )
 
         # Check for MISSING components - only check direct children at current level
-        present_components = set(structure.keys())
-
         # Get the original direct children at this level (not nested components)
         if hasattr(object, "original_direct_children"):
             original_direct_children = object.original_direct_children
@@ -824,14 +917,18 @@ class Station:
             # Fallback: use current structure keys (shouldn't happen with updated product/group classes)
             original_direct_children = set(structure.keys())
 
-        for component_name in self.step_names:
-            if component_name not in present_components:
-                # Only log as missing if it was a direct child at this level
-                if component_name in original_direct_children:
-                    SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
+        # Only original direct children this station can process are reported as missing
+        missing_components = (
+            self.step_names_set & original_direct_children
+        ).difference(structure)
+        if missing_components:
+            # Log in step order
+            for component_name in self.step_names:
+                if component_name in missing_components:
+                    add_event(
                         case_id=object.caseID,
                         object_id=object.ID,
-                        object_type=type(object).__name__,
+                        object_type=object_type_name,
                         activity="inspection",
                         activity_state="complete",
                         resource_id=self.name,
@@ -843,21 +940,26 @@ class Station:
                     # Downstream stations shouldn't try to process missing components
                     if component_name in object.components_to_scan:
                         object.components_to_scan.remove(component_name)
-                        helper_functions.debug_print(
-                            f"  Removed missing component '{component_name}' from components_to_scan"
-                        )
+                        if helper_functions.DEBUG:
+                            helper_functions.debug_print(
+                                f"  Removed missing component '{component_name}' from components_to_scan"
+                            )
         # get mandatory components in product that this station can disassemble in own list to remove them first
-        mandatory_components = helper_functions.get_mandatory_components(structure)
-
-        # get highest root of each mandatory component
-        mandatory_components_roots = [
-            helper_functions.get_highest_parent(structure, c)
-            for c in mandatory_components
-        ]
-        # filter mandatory_components_roots to only include those that are in steps_todo
-        self.mandatory_steps = [
-            c for c in mandatory_components_roots if c in self.steps_todo
-        ]
+        # (only needed if this station has steps to do for this product)
+        if self.steps_todo:
+            mandatory_components = helper_functions.get_mandatory_components(structure)
+
+            # get highest root of each mandatory component
+            mandatory_components_roots = [
+                helper_functions.get_highest_parent(structure, c)
+                for c in mandatory_components
+            ]
+            # filter mandatory_components_roots to only include those that are in steps_todo
+            self.mandatory_steps = [
+                c for c in mandatory_components_roots if c in self.steps_todo
+            ]
+        else:
+            self.mandatory_steps = []
 
         # start self.disassemble_if_not_blocked for all mandatory steps this station can perform
         while self.mandatory_steps:
@@ -875,12 +977,12 @@ class Station:
             # if disassembly fails, remove component from steps_todo and mandatory_steps so it is not attempted again
             except Exception as e:
                 # print(e)
-                self.steps_todo.remove(key)
+                del self.steps_todo[key]
                 self.mandatory_steps.remove(key)
 
         # start self.disassemble_if_not_blocked for all remaining steps to do
         while self.steps_todo:
-            key = self.steps_todo[0]
+            key = next(iter(self.steps_todo))
             try:
                 # Pass the product type as parent_component for top-level disassembly
                 yield from self.disassemble_if_not_blocked(
@@ -893,7 +995,7 @@ class Station:
             # if disassembly fails, remove component from steps_todo so it is not attempted again
             except Exception as e:
                 # print(str(e))
-                self.steps_todo.remove(key)
+                del self.steps_todo[key]
 
         # Return to BUSY state after scanning is complete
         self.state.enter_state(
@@ -907,7 +1009,7 @@ class Station:
         object: object,
         target_mandatory: bool = None,
         parent_component: str = None,
-        checked_components: List[str] = None,
+        checked_components: Set[str] = None,
     ):
         """This method attempts to disassemble a target component and recursively calls itself for any
         components blocking the target component. It manages state transitions during this process.
@@ -915,12 +1017,12 @@ class Station:
         # Remain in BUSY state for this operation
         # Track which components have already been checked
         if checked_components is None:
-            checked_components = []  # Only create new list on first call
+            checked_components = set()  # Only create new set on first call
 
         if component in checked_components:
             return  # Already checked this component, avoid infinite loop
 
-        checked_components.append(component)
+        checked_components.add(component)
 
         # set target_mandatory to value of component from first call of this method
         if target_mandatory is None:
@@ -930,12 +1032,15 @@ class Station:
         components_blocking = helper_functions.get_blocking_components(
             structure, component
         )
-        # Filter those that are still in the product
-        components_blocking_current = [
-            c
-            for c in components_blocking
-            if helper_functions.is_in_product(structure, c)
-        ]
+        # Filter those that are still in the product (one walk of the structure
+        # instead of one is_in_product walk per blocking component)
+        if components_blocking:
+            present_components = set(helper_functions.list_components(structure))
+            components_blocking_current = [
+                c for c in components_blocking if c in present_components
+            ]
+        else:
+            components_blocking_current = []
 
         # If there are components that block the current one, look at them first
         if components_blocking_current:
@@ -958,7 +1063,7 @@ class Station:
         # If no components are blocking the current one, disassemble it
         else:
             # disassemble only if this station can perform this step
-            if component in self.step_names:
+            if component in self.step_names_set:
                 # disassemble only if this step has not yet been done
                 if component in self.steps_todo:
                     # launch disassembly of component - pass parent_component for tracking
@@ -974,7 +1079,7 @@ class Station:
                     # their step was already done and doesn't need to be done again
                     if component in self.steps_todo:
                         # remove blocking component from self.steps_todo
-                        self.steps_todo.remove(component)
+                        del self.steps_todo[component]
 
                         # add blocking component to self.steps_done
                         self.steps_done.append(component)
@@ -1003,22 +1108,48 @@ class Station:
         self.state.enter_state(StationState.BUSY, f"Disassembling {comp_key}")
 
         disassembled_quantity = 0
+        product_type_name = type(product).__name__
+        add_event = helper_functions.add_to_eventlog_v3
+        min_condition = self.step_condition_by_name[comp_key]
+        product_structure = product.content["structure"]
+        # Check if this component blocks any other components (the structure does not
+        # change while the units of this component are disassembled)
+        blocks_other_component = any(
+            comp_key in other_element.get("blocked_by", ())
+            for other_element in product_structure.values()
+        )
+
+        # Deviation parameters and random number generator are the same for every unit
+        min_deviation = comp_properties["condition_dev_min"]
+        max_deviation = comp_properties["condition_dev_max"]
+        likely_deviation = comp_properties["condition_dev_mu"]
+        deterministic = (
+            SimulationConfig.behavior_mode == SimulationBehavior.DETERMINISTIC
+        )
+        triangular = SimulationConfig.rng_components.triangular
+
+        # Determine if a group or component is disassembled and build its ID
+        # (used for the target and removed events of every unit)
+        is_group = "structure" in comp_properties
+        if is_group:
+            target_object_type = "group"
+        else:
+            target_object_type = "comp"
+        target_component_id = f"{target_object_type}_{product.caseID:03d}_{comp_key}"
+        # Class name of the created objects for the event log
+        created_type_name = "group" if is_group else "component"
+        # Parent ID of the created groups and components (same for every unit)
+        parent_id = get_parent_id(product)
 
         # Disassemble component as often as specified by quantity in json
         for i in range(comp_properties["quantity"]):
             # determine random condition of component as superposition of product condition and random deviation
-            min_deviation = comp_properties["condition_dev_min"]
-            max_deviation = comp_properties["condition_dev_max"]
-            likely_deviation = comp_properties["condition_dev_mu"]
-
-            if SimulationConfig.behavior_mode == SimulationBehavior.DETERMINISTIC:
+            if deterministic:
                 # Deterministic -> always use mode value
                 deviation = likely_deviation
             else:
                 # Seeded -> use random number generator
-                deviation = SimulationConfig.rng_components.triangular(
-                    min_deviation, max_deviation, likely_deviation
-                )
+                deviation = triangular(min_deviation, max_deviation, likely_deviation)
             component_condition = product.condition + deviation
             # Ensure the component condition is within the range [0, 1]
             component_condition = min(max(component_condition, 0), 1)
@@ -1026,57 +1157,36 @@ class Station:
             # ==========================================
             # DISASSEMBLY DECISION
             # ==========================================
-            # Check if this component blocks any other components
-            blocks_other_component = False
-            for other_key, other_element in product.content["structure"].items():
-                if comp_key in other_element.get("blocked_by", []):
-                    blocks_other_component = True
-                    break
-
             # True if either target_mandatory or mandatory component
             # or blocking other components or a required minimum condtion is met
             disassembly_decision = (
                 target_mandatory
                 or comp_properties["mandatory"]
                 or blocks_other_component
-                or (
-                    component_condition
-                    >= self.step_conditions[self.step_names.index(comp_key)]
-                )
+                or component_condition >= min_condition
             )
 
             # Debug log decision
-            helper_functions.debug_print(
-                f"  Disassembly decision for {comp_key}: {disassembly_decision} "
-                f"(mandatory={target_mandatory or comp_properties['mandatory']}, "
-                f"blocking={blocks_other_component}, "
-                f"condition={component_condition:.2f} >= {self.step_conditions[self.step_names.index(comp_key)]:.2f})"
-            )
+            if helper_functions.DEBUG:
+                helper_functions.debug_print(
+                    f"  Disassembly decision for {comp_key}: {disassembly_decision} "
+                    f"(mandatory={target_mandatory or comp_properties['mandatory']}, "
+                    f"blocking={blocks_other_component}, "
+                    f"condition={component_condition:.2f} >= {min_condition:.2f})"
+                )
 
             # Check if component should be disassembled
             if disassembly_decision:
-                # Determine if a group or component is disassembled
-                if "structure" in comp_properties:
-                    target_object_type = "group"
-                else:
-                    target_object_type = "comp"
-
-                # Build the target component ID
-                # target_component_id = f"comp_{product.caseID:03d}_{comp_key}"
-                target_component_id = (
-                    f"{target_object_type}_{product.caseID:03d}_{comp_key}"
-                )
-
                 # Add quantity suffix if needed
                 if comp_properties["quantity"] > 1:
                     target_suffix = f"_{i + 1}/{comp_properties['quantity']}"
                 else:
                     target_suffix = ""
 
-                SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
+                add_event(
                     case_id=product.caseID,
                     object_id=product.ID,  # The product/group being disassembled
-                    object_type=type(product).__name__,
+                    object_type=product_type_name,
                     activity="disassembly",
                     activity_state="start",
                     resource_id=self.name,
@@ -1093,8 +1203,8 @@ class Station:
                 interrupt_disassembly = False
 
                 # Read required resources for this step
-                step_equipment = self.step_equipment[self.step_names.index(comp_key)]
-                step_employees = self.step_employees[self.step_names.index(comp_key)]
+                step_equipment = self.step_equipment_by_name[comp_key]
+                step_employees = self.step_employees_by_name[comp_key]
 
                 # Track disassembly time spend on this component (for debugging)
                 disassembly_time = 0
@@ -1222,41 +1332,17 @@ class Station:
                             step_completed = True
 
                             # LOG: DISASSEMBLY COMPLETED (= component removed)
-                            # Build the removed component ID
-                            removed_component_id = (
-                                f"comp_{product.caseID:03d}_{comp_key}"
-                            )
-
-                            # Add quantity suffix if needed
-                            if comp_properties["quantity"] > 1:
-                                removed_suffix = (
-                                    f"_{i + 1}/{comp_properties['quantity']}"
-                                )
-                            else:
-                                removed_suffix = ""
-
-                            # Before logging disassembly,complete:
-                            if "structure" in comp_properties:
-                                # It's going to be a group
-                                removed_object_type = "group"
-                            else:
-                                # It's going to be a component
-                                removed_object_type = "comp"
-
-                            removed_component_id = (
-                                f"{removed_object_type}_{product.caseID:03d}_{comp_key}"
-                            )
-
-                            SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
+                            # The removed unit has the same ID and suffix as the target
+                            add_event(
                                 case_id=product.caseID,
                                 object_id=product.ID,
-                                object_type=type(product).__name__,
+                                object_type=product_type_name,
                                 activity="disassembly",
                                 activity_state="complete",
                                 resource_id=self.name,
                                 resource_location="workstation",
                                 timestamp=self.env.now,
-                                related_objects=f"{removed_component_id}{removed_suffix}:removed",
+                                related_objects=f"{target_component_id}{target_suffix}:removed",
                             )
 
                     # Interuption of disassembly by failure or end of working hours
@@ -1282,13 +1368,9 @@ class Station:
                             )
 
                 # Group of components was disassembled
-                if "structure" in comp_properties:
-                    # Create group
+                if is_group:
+                    # Create group (its parts_count is counted from its copy of the structure)
                     c = group(comp_key, product, comp_properties)
-                    # set parts_count of group
-                    c.parts_count = helper_functions.count_parts(
-                        comp_properties["structure"]
-                    )
                     # Set component and parent_component -> tracking
                     c.component = comp_key
                     c.parent_component = product.component
@@ -1314,74 +1396,47 @@ class Station:
                 self.state.enter_state(StationState.BLOCKED, f"Storing {comp_key}")
 
                 # When handling a disassembled group
-                if "structure" in comp_properties:
+                if is_group:
+                    # Components of the group whose disassembly has not yet been attempted
+                    group_keys_to_scan = comp_properties["structure"].keys() & set(
+                        product.components_to_scan
+                    )
                     # Check if group contains elements that are in step_names
-                    group_done = True
-                    for key, element in comp_properties["structure"].items():
-                        # If so put group in workstation for further disassembly
-                        if (
-                            key in self.step_names
-                            and key in product.components_to_scan
-                            and key != comp_key
-                        ):
-                            # If so, put group back in workstation for further disassembly
-                            group_done = False
-                            yield self.workstation.put(c)
-
-                            # LOG: COMPONENT ENTERS STATION (Modeled as re-entering of reamining parts)
-                            # Determine parent ID based on the product object type
-                            if type(product).__name__ == "product":
-                                # parent_id = f"prod_{product.ID:03d}"
-                                parent_id = product.ID
-                            elif type(product).__name__ == "group":
-                                # For groups, ID is like "1_productname-groupname1"
-                                # Cannot use :03d for formatting
-                                if "_" in str(product.ID):
-                                    parts = str(product.ID).split("_", 1)
-                                    if parts[0].isdigit():
-                                        # Reformat with leading zeros
-                                        parent_id = (
-                                            f"group_{int(parts[0]):03d}_{parts[1]}"
-                                        )
-                                    else:
-                                        # If format is unexpected, use as is
-                                        parent_id = f"group_{product.ID}"
-                                else:
-                                    # No underscore, try to format as number
-                                    parent_id = f"group_{product.ID}"
-                            else:
-                                # Fallback
-                                parent_id = f"obj_{product.ID}"
-
-                            SimulationConfig.eventlog = (
-                                helper_functions.add_to_eventlog_v3(
-                                    case_id=c.caseID,
-                                    object_id=c.ID,
-                                    object_type=type(c).__name__,
-                                    activity="object",
-                                    activity_state="created",
-                                    resource_id=self.name,
-                                    resource_location="workstation",
-                                    timestamp=self.env.now,
-                                    related_objects=f"{parent_id}:parent",
-                                )
-                            )
+                    group_done = not (
+                        (group_keys_to_scan & self.step_names_set) - {comp_key}
+                    )
+                    # Track workstation membership of the group instead of scanning the store
+                    group_in_workstation = False
+                    # If so, put group back in workstation for further disassembly
+                    if not group_done:
+                        yield self.workstation.put(c)
+                        group_in_workstation = True
+
+                        # LOG: COMPONENT ENTERS STATION (Modeled as re-entering of reamining parts)
+                        add_event(
+                            case_id=c.caseID,
+                            object_id=c.ID,
+                            object_type=created_type_name,
+                            activity="object",
+                            activity_state="created",
+                            resource_id=self.name,
+                            resource_location="workstation",
+                            timestamp=self.env.now,
+                            related_objects=f"{parent_id}:parent",
+                        )
 
-                            break
                     # if group cant be disassembled further at this station,
                     # check if it has components whose disassembly has not yet been attempted
                     if group_done:
-                        for key, element in comp_properties["structure"].items():
-                            if key in product.components_to_scan and key != c.type:
-                                group_done = False
+                        group_done = not (group_keys_to_scan - {c.type})
                         # if not all components have been checked, put group in outbuf_to_next
                         if not group_done:
                             # put c in outbuf_to_next for further disassembly downstream
                             # LOG: HANDLING DONE (Component leaves station)
-                            SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
+                            add_event(
                                 case_id=c.caseID,
                                 object_id=c.ID,
-                                object_type=type(c).__name__,
+                                object_type=created_type_name,
                                 activity="handling",
                                 activity_state="done",
                                 resource_id=self.name,
@@ -1390,42 +1445,25 @@ class Station:
                                 related_objects=None,  # Just leaving - not tracking needed
                             )
 
-                            yield self.env.timeout(self.handling_time)
-                            yield self.outbuf_to_next.put(c)
-
-                            # LOG: COMPONENT ENTERS OUTGOING BUFFER
-                            SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
-                                case_id=c.caseID,
-                                object_id=c.ID,
-                                object_type=type(c).__name__,
-                                activity="buffer",
-                                activity_state="enter",
-                                resource_id=self.name,
-                                resource_location="outbuf_to_next",
-                                timestamp=self.env.now,
-                                related_objects=None,  # Just moving to buffer, no parent tracking needed
-                            )
-
                             # order outbuf_to_next to pick up component if end of line
-                            if self in self.simulation.ends_of_line:
-                                self.env.process(
-                                    functions.ordering(
-                                        self.simulation.outgoing_storage,
-                                        self.simulation,
-                                        "outbuf_to_next",
-                                    )
-                                )
+                            yield from put_in_output_buffer(
+                                self,
+                                c,
+                                self.outbuf_to_next,
+                                "outbuf_to_next",
+                                self.is_end_of_line,
+                            )
 
                             # clear c from workstation to make sure it only exists once
-                            if c in self.workstation.items:
-                                yield self.workstation.get(lambda x: x == c)
+                            if group_in_workstation:
+                                self.workstation.items.remove(c)
 
                         # All components have been checked, put group in outbuf_to_store
                         else:
-                            SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
+                            add_event(
                                 case_id=c.caseID,
                                 object_id=c.ID,
-                                object_type=type(c).__name__,
+                                object_type=created_type_name,
                                 activity="handling",
                                 activity_state="end",
                                 resource_id=self.name,
@@ -1434,63 +1472,22 @@ class Station:
                                 related_objects=None,  # Just leaving - not tracking needed
                             )
 
-                            yield self.env.timeout(self.handling_time)
-                            yield self.outbuf_to_store.put(c)
-
-                            # LOG: COMPONENTS ENTERS OUTGOING BUFFER
-                            SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
-                                case_id=c.caseID,
-                                object_id=c.ID,
-                                object_type=type(c).__name__,
-                                activity="buffer",
-                                activity_state="enter",
-                                resource_id=self.name,
-                                resource_location="outbuf_to_store",
-                                timestamp=self.env.now,
-                                related_objects=None,  # Just moving to buffer, no parent tracking needed
-                            )
-
                             # order outgoing_storage to pick up component
-                            self.env.process(
-                                functions.ordering(
-                                    self.simulation.outgoing_storage,
-                                    self.simulation,
-                                    "outbuf_to_store",
-                                )
+                            yield from put_in_output_buffer(
+                                self, c, self.outbuf_to_store, "outbuf_to_store", True
                             )
 
                             # clear c from workstation to make sure it only exists once
-                            if c in self.workstation.items:
-                                yield self.workstation.get(lambda x: x == c)
+                            if group_in_workstation:
+                                self.workstation.items.remove(c)
 
                 # component without structure
                 else:
                     # LOG: NEW COMPONENT CREATED FROM DISASSEMBLY PROCESS
-                    if type(product).__name__ == "product":
-                        # parent_id = f"prod_{product.ID:03d}"
-                        parent_id = product.ID
-                    elif type(product).__name__ == "group":
-                        # For groups, ID is like "1_productname-groupname1"
-                        # Cannot use :03d for formatting
-                        if "_" in str(product.ID):
-                            parts = str(product.ID).split("_", 1)
-                            if parts[0].isdigit():
-                                # Reformat with leading zeros
-                                parent_id = f"group_{int(parts[0]):03d}_{parts[1]}"
-                            else:
-                                # If format is unexpected, use as is
-                                parent_id = f"group_{product.ID}"
-                        else:
-                            # No underscore, try to format as number
-                            parent_id = f"group_{product.ID}"
-                    else:
-                        # Fallback
-                        parent_id = f"obj_{product.ID}"
-
-                    SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
+                    add_event(
                         case_id=c.caseID,
                         object_id=c.ID,
-                        object_type=type(c).__name__,
+                        object_type=created_type_name,
                         activity="object",
                         activity_state="created",
                         resource_id=self.name,
@@ -1499,29 +1496,9 @@ class Station:
                         related_objects=f"{parent_id}:parent",
                     )
 
-                    # put component in outbuf_to_store
-                    yield self.env.timeout(self.handling_time)
-                    yield self.outbuf_to_store.put(c)
-
-                    SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
-                        case_id=c.caseID,
-                        object_id=c.ID,
-                        object_type=type(c).__name__,
-                        activity="buffer",
-                        activity_state="enter",
-                        resource_id=self.name,
-                        resource_location="outbuf_to_store",
-                        timestamp=self.env.now,
-                        related_objects=None,  # Just moving to buffer, no parent tracking needed
-                    )
-
-                    # order outgoing_storage to pick up component
-                    self.env.process(
-                        functions.ordering(
-                            self.simulation.outgoing_storage,
-                            self.simulation,
-                            "outbuf_to_store",
-                        )
+                    # put component in outbuf_to_store and order outgoing_storage to pick it up
+                    yield from put_in_output_buffer(
+                        self, c, self.outbuf_to_store, "outbuf_to_store", True
                     )
 
                 # increase disassembled_quantity for logging
@@ -1535,10 +1512,10 @@ class Station:
             # component not disassembled due to condition being too low
             else:
                 # LOG: COMPONENT WAS SKIPPED (Due to low quality)
-                SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
+                add_event(
                     case_id=product.caseID,
                     object_id=product.ID,
-                    object_type=type(product).__name__,
+                    object_type=product_type_name,
                     activity="inspection",
                     activity_state="skipped",
                     resource_id=self.name,
@@ -1551,13 +1528,14 @@ class Station:
                 # to prevent infinite loops
                 if comp_key in product.components_to_scan:
                     product.components_to_scan.remove(comp_key)
-                    helper_functions.debug_print(
-                        f"  Removed {comp_key} from components_to_scan due to low condition"
-                    )
+                    if helper_functions.DEBUG:
+                        helper_functions.debug_print(
+                            f"  Removed {comp_key} from components_to_scan due to low condition"
+                        )
 
                 # get components blocked by this component
                 blocked_components = helper_functions.get_components_blocked_by(
-                    product.content["structure"], comp_key
+                    product_structure, comp_key
                 )
 
                 # remove blocked components from components_to_scan and steps_todo of product
@@ -1565,17 +1543,18 @@ class Station:
                 for blocked_component in blocked_components:
                     if blocked_component in product.components_to_scan:
                         product.components_to_scan.remove(blocked_component)
-                    if blocked_component in self.steps_todo:
-                        self.steps_todo.remove(blocked_component)
+                    self.steps_todo.pop(blocked_component, None)
 
         # increase level_of_disassembly of product by share of component in product structure
-        if "structure" in comp_properties:
+        if is_group:
+            comp_parts = helper_functions.count_parts(comp_properties["structure"])
             product.level_of_disassembly += (
-                helper_functions.count_parts(comp_properties["structure"])
+                comp_parts
                 * (disassembled_quantity / comp_properties["quantity"])
                 / product.parts_count
             )
         else:
+            comp_parts = 0
             product.level_of_disassembly += (1 / product.parts_count) * (
                 disassembled_quantity / comp_properties["quantity"]
             )
@@ -1583,10 +1562,12 @@ class Station:
         # remove disassembled component from product structure only if it was fully disassembled
         if disassembled_quantity == comp_properties["quantity"]:
             # remove disassembled element from product
-            del product.content["structure"][comp_key]
+            del product_structure[comp_key]
+            # the element itself plus the parts of its structure
+            product.remaining_parts -= comp_parts + 1
         else:
             # reduce quantity of disassembled element
-            product.content["structure"][comp_key]["quantity"] -= disassembled_quantity
+            product_structure[comp_key]["quantity"] -= disassembled_quantity
 
         # remove step from components_to_scan of product (to determine which components havent been checked yet)
         if comp_key in product.components_to_scan:
@@ -1654,9 +1635,9 @@ class Station:
         print(f"\nTime consistency check for {self.name} at {self.env.now:.2f}:")
         for state, time in time_metrics.items():
             print(f"  {state.capitalize()} time: {time:.2f}")
-            print(f"  Total tracked time: {tracked_time:.2f}")
-            print(f"  Simulation time: {total_time:.2f}")
-            print(f"  Difference: {tracked_time - total_time:.2f}")
+        print(f"  Total tracked time: {tracked_time:.2f}")
+        print(f"  Simulation time: {total_time:.2f}")
+        print(f"  Difference: {tracked_time - total_time:.2f}")
 
         # Check for inconsistency - tracked time should match total time
         tolerance = 0.1  # Add small tolerance for floating point errors
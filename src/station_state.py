@@ -18,6 +18,7 @@ States:
 
 Key Methods:
 - enter_state(): Transition to new state with proper time accounting
+  (bound to one of the two versions below when the state machine is created)
 - _enter_state_full(): Full-featured version with history tracking
 - _enter_state_optimized(): Performance-optimized version
 - get_state_time(): Get accumulated time in specific state
@@ -30,8 +31,18 @@ The class supports two modes:
 """
 
 import os
+from collections import namedtuple
 
 import helper_functions
+from src.g import SimulationConfig
+
+# One recorded state transition, kind is "enter", "remain" or "exit" (exit
+# entries carry the duration of the state, enter and remain entries the
+# previous state). context is the raw caller string, export_logs adds the
+# prefixes for remain and exit entries
+HistoryEntry = namedtuple(
+    "HistoryEntry", ["kind", "time", "state", "previous_state", "duration", "context"]
+)
 
 
 class StationState:
@@ -48,9 +59,25 @@ class StationState:
         current_state (str): The current state of the station
         state_start_time (float): The time when the current state was entered
         time_in_states (dict): Accumulated time spent in each state
-        state_history (list): Complete history of state transitions for debugging
+        state_history (list): Complete history of state transitions (HistoryEntry)
+            for debugging
+        track_history (bool): Whether state_history is recorded (set in config)
+        enter_state (callable): Transition method for the configured mode,
+            either _enter_state_full or _enter_state_optimized
     """
 
+    # One state machine per station, so attributes are fixed via slots
+    __slots__ = (
+        "env",
+        "station_name",
+        "current_state",
+        "state_start_time",
+        "time_in_states",
+        "state_history",
+        "track_history",
+        "enter_state",
+    )
+
     # State constants
     IDLE = "idle"
     BUSY = "busy"
@@ -66,8 +93,6 @@ class StationState:
             env (simpy.Environment): The simulation environment
             station_name (str): The name of the station this state machine belongs to
         """
-        from src.g import SimulationConfig
-
         self.env = env
         self.station_name = station_name
 
@@ -86,50 +111,28 @@ class StationState:
 
         # Initialize history only if tracking is enabled (set in config)
         self.state_history = []
+        self.track_history = SimulationConfig.station_state_tracking
 
-        if SimulationConfig.station_state_tracking:
+        if self.track_history:
             # Initial state entry
             self.state_history.append(
-                {
-                    "entry_time": self.state_start_time,
-                    "state": self.current_state,
-                    "previous_state": None,
-                    "context": "Initial state",
-                }
-            )
-
-    def enter_state(self, new_state, context=""):
-        """
-        Transition to a new state with proper time accounting.
-
-        This method routes to either the full-featured version or the
-        performance-optimized version based on configuration settings.
-
-        Args:
-            new_state (str): The state to enter
-            context (str): Description of the reason for this state change
-
-        Returns:
-            float: Time spent in the previous state
-        """
-        # Check if performance mode is enabled
-        from src.g import SimulationConfig
-
-        # Debug log state changes
-        if new_state != self.current_state:
-            helper_functions.debug_print(
-                f"Station {self.station_name} state change: {self.current_state} -> {new_state} ({context})"
+                HistoryEntry(
+                    "enter",
+                    self.state_start_time,
+                    self.current_state,
+                    None,
+                    None,
+                    "Initial state",
+                )
             )
 
-        if (
-            hasattr(SimulationConfig, "optimize_state_machine")
-            and SimulationConfig.optimize_state_machine
-        ):
-            # Call optimized version (better performance)
-            return self._enter_state_optimized(new_state, context)
+        # Bind the transition implementation once, the mode does not change
+        # during a run (optimized: better performance, full: good for
+        # debugging / during development)
+        if getattr(SimulationConfig, "optimize_state_machine", False):
+            self.enter_state = self._enter_state_optimized
         else:
-            # Call full-featured version (good for debugging / during development)
-            return self._enter_state_full(new_state, context)
+            self.enter_state = self._enter_state_full
 
     def _enter_state_full(self, new_state, context=""):
         """
@@ -145,60 +148,56 @@ class StationState:
         Raises:
             ValueError: If the new state is not valid
         """
-        if new_state not in self.time_in_states:
-            raise ValueError(f"Invalid state: {new_state}")
+        old_state = self.current_state
 
-        # If  already in this state, log it and return 0
-        if new_state == self.current_state:
+        # If  already in this state, log it and return 0 (the current state is
+        # always valid, so this is checked before the validation)
+        if new_state == old_state:
             # Only add to history if tracking is enabled (set in config)
-            from src.g import SimulationConfig
-
-            if SimulationConfig.station_state_tracking:
+            if self.track_history:
                 self.state_history.append(
-                    {
-                        "entry_time": self.env.now,
-                        "state": new_state,
-                        "previous_state": self.current_state,
-                        "context": f"Remained in state: {context}",
-                    }
+                    HistoryEntry(
+                        "remain",
+                        self.env.now,
+                        new_state,
+                        old_state,
+                        None,
+                        context,
+                    )
                 )
             return 0
 
+        if new_state not in self.time_in_states:
+            raise ValueError(f"Invalid state: {new_state}")
+
+        # Debug log state changes
+        if helper_functions.DEBUG:
+            helper_functions.debug_print(
+                f"Station {self.station_name} state change: {old_state} -> {new_state} ({context})"
+            )
+
         # Calculate time spent in previous state
         current_time = self.env.now
         time_spent = max(0, current_time - self.state_start_time)
 
         # Account for time spent in previous state
-        self.time_in_states[self.current_state] += time_spent
+        self.time_in_states[old_state] += time_spent
 
         # Only log state history if tracking is enabled (set in config)
-        from src.g import SimulationConfig
-
-        if SimulationConfig.station_state_tracking:
+        if self.track_history:
             # Log the state exit for debugging
             self.state_history.append(
-                {
-                    "exit_time": current_time,
-                    "state": self.current_state,
-                    "duration": time_spent,
-                    "context": f"Exiting {self.current_state}",
-                }
+                HistoryEntry("exit", current_time, old_state, None, time_spent, None)
             )
 
         # Enter new state
-        old_state = self.current_state
         self.current_state = new_state
         self.state_start_time = current_time
 
-        if SimulationConfig.station_state_tracking:
+        if self.track_history:
             # Log the state entry for debugging
             self.state_history.append(
-                {
-                    "entry_time": current_time,
-                    "state": new_state,
-                    "previous_state": old_state,
-                    "context": context,
-                }
+                HistoryEntry("enter", current_time, new_state, old_state, None, context)
             )
 
         # Return time spent in previous state for reference
@@ -211,18 +210,26 @@ class StationState:
         This is a performance-optimized version that skips non-essential
         operations while maintaining accurate time accounting.
         """
+        old_state = self.current_state
+
         # Skip redundant state changes completely - On average skips 50 % (optimization potential)
-        if new_state == self.current_state:
+        if new_state == old_state:
             return 0
 
         # No validation in optimized mode - assumes valid states
 
+        # Debug log state changes
+        if helper_functions.DEBUG:
+            helper_functions.debug_print(
+                f"Station {self.station_name} state change: {old_state} -> {new_state} ({context})"
+            )
+
         # Calculate time spent in previous state
         current_time = self.env.now
         time_spent = max(0, current_time - self.state_start_time)
 
         # Account for time spent in previous state
-        self.time_in_states[self.current_state] += time_spent
+        self.time_in_states[old_state] += time_spent
 
         # Only the minimal required operations to change state
         self.current_state = new_state
@@ -258,12 +265,6 @@ class StationState:
 
     def export_logs(self, filename=None):
         """Export logs to debug folder."""
-        from src.g import SimulationConfig
-
-        # Create debug subdirectory within the experiment output
-        debug_output_path = os.path.join(SimulationConfig.output_path, "debug")
-        os.makedirs(debug_output_path, exist_ok=True)
-
         # Skip export if tracking is disabled
         if not SimulationConfig.station_state_tracking:
             return
@@ -290,23 +291,31 @@ class StationState:
                 f.write(f"State tracking log for {self.station_name}\n")
                 f.write("=" * 50 + "\n")
 
+                # Format the whole history first and write it in one call
+                lines = []
                 for entry in self.state_history:
-                    if "exit_time" in entry:
-                        f.write(
-                            f"Time {entry['exit_time']:.2f}: Exited state {entry['state']} "
-                            f"after {entry['duration']:.2f} minutes. {entry['context']}\n"
+                    if entry.kind == "exit":
+                        lines.append(
+                            f"Time {entry.time:.2f}: Exited state {entry.state} "
+                            f"after {entry.duration:.2f} minutes. Exiting {entry.state}\n"
+                        )
+                    elif entry.kind == "remain":
+                        lines.append(
+                            f"Time {entry.time:.2f}: Entered state {entry.state} "
+                            f"from {entry.previous_state}. Remained in state: {entry.context}\n"
                         )
                     else:
-                        if entry["previous_state"] is None:
-                            f.write(
-                                f"Time {entry['entry_time']:.2f}: Started in state {entry['state']}. "
-                                f"{entry['context']}\n"
+                        if entry.previous_state is None:
+                            lines.append(
+                                f"Time {entry.time:.2f}: Started in state {entry.state}. "
+                                f"{entry.context}\n"
                             )
                         else:
-                            f.write(
-                                f"Time {entry['entry_time']:.2f}: Entered state {entry['state']} "
-                                f"from {entry['previous_state']}. {entry['context']}\n"
+                            lines.append(
+                                f"Time {entry.time:.2f}: Entered state {entry.state} "
+                                f"from {entry.previous_state}. {entry.context}\n"
                             )
+                f.writelines(lines)
 
                 # Add current state duration
                 current_time = self.env.now
@@ -318,12 +327,13 @@ class StationState:
                 # Add summary of time in each state
                 f.write("\nTime in each state:\n")
                 total_time = 0
+                share_base = max(1, current_time)
                 for state, time in self.time_in_states.items():
                     if state == self.current_state:
                         time += current_duration
                     total_time += time
                     f.write(
-                        f"  {state}: {time:.2f} minutes ({(time / max(1, current_time)) * 100:.1f}%)\n"
+                        f"  {state}: {time:.2f} minutes ({(time / share_base) * 100:.1f}%)\n"
                     )
 
                 f.write(f"\nTotal simulation time: {current_time:.2f} minutes\n")
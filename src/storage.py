@@ -44,12 +44,14 @@ class Storage:
         entry_capacity (int): The maximum number of items that can be held in the entry.
         storage_capacity (int): The maximum number of items that can be held in the storage.
         exit_capacity (int): The maximum number of items that can be held in the exits.
-        entry (simpy.FilterStore): Filter store representing the entry point of the storage unit.
-        station_storage (simpy.FilterStore): Filter store representing the main storage area.
+        entry (simpy.Store): Store representing the entry point of the storage unit.
+        station_storage (simpy.Store): Store representing the main storage area.
         outbuf_to_next (simpy.FilterStore): Filter store representing the disassembly exit of the storage unit.
         outbuf_to_store (simpy.FilterStore): Filter store representing the outgoing exit of the storage unit.
         predecessors (list): List of predecessor storage units from which items can be ordered.
+        is_end_of_line (bool): Whether no other element orders from this storage.
         handling_time (float): Time required to handle an item.
+        push_mode (bool): Whether the material flow mode is push (set in config).
         order_threshold (int): The threshold for ordering new items.
         orders_open (int): The number of orders currently open.
 
@@ -80,8 +82,10 @@ class Storage:
         self.entry_capacity = entry_capacity
         self.storage_capacity = storage_capacity
         self.exit_capacity = exit_capacity
-        self.entry = simpy.FilterStore(env, self.entry_capacity)
-        self.station_storage = simpy.FilterStore(env, self.storage_capacity)
+        # Entry and main storage area are only read with plain get(), so they use
+        # a Store; the exit buffers stay FilterStores for filtered transport pickup
+        self.entry = simpy.Store(env, self.entry_capacity)
+        self.station_storage = simpy.Store(env, self.storage_capacity)
         # DEBUG
         if self.name == "b-01_buffer_01":
             helper_functions.debug_print(f"b-01 initialized with storage_capacity={self.storage_capacity}")
@@ -89,11 +93,16 @@ class Storage:
         self.outbuf_to_next = simpy.FilterStore(env, self.exit_capacity)
         self.outbuf_to_store = simpy.FilterStore(env, self.exit_capacity)
         self.predecessors = predecessors
+        self.is_end_of_line = False  # set by Simulation._configure_network
         # NEW: Load variant routing configuration
         self.variant_routing = variant_routing if variant_routing else {}
         self.handling_time = handling_time
         self.order_threshold = entry_order_threshold
         self.open_orders = 0
+        # Material flow mode is fixed for the whole run
+        self.push_mode = (
+            getattr(SimulationConfig, "material_flow_mode", "pull") == "push"
+        )
 
         # Debug: Check material flow mode
         helper_functions.debug_print(
@@ -112,10 +121,8 @@ class Storage:
             )
 
             # In push mode, start ordering process to push items downstream
-            if getattr(SimulationConfig, "material_flow_mode", "pull") == "push":
+            if self.push_mode:
                 helper_functions.debug_print("Starting push ordering for incoming_storage...")
-                import functions
-
                 # Start push process for outbuf_to_next
                 self.ordering_process = env.process(
                     functions.ordering(self, simulation, "outbuf_to_next")
@@ -128,12 +135,10 @@ class Storage:
             )
         else:
             # Normal intermediate storage processes
-            if getattr(SimulationConfig, "material_flow_mode", "pull") == "push":
+            if self.push_mode:
                 # PUSH MODE: Direct flow + push ordering
                 self.push_flow_process = env.process(self.push_flow_direct())
 
-                import functions
-
                 # Start push process for outbuf_to_next
                 self.ordering_process_next = env.process(
                     functions.ordering(self, simulation, "outbuf_to_next")
@@ -152,8 +157,6 @@ class Storage:
                 self.get_from_storage_process = env.process(self.get_from_storage())
 
                 # NEW: Add ordering process for intermediate storages
-                import functions
-
                 self.entry_ordering_process = env.process(
                     functions.ordering(self, simulation, "outbuf_to_next")
                 )
@@ -169,8 +172,6 @@ class Storage:
         # print(
         #     f"DEBUG {self.name}: Delay complete, starting ordering at time {self.env.now}"
         # )
-        import functions
-
         self.entry_ordering_process = self.env.process(
             functions.ordering(self, self.simulation, "outbuf_to_next")
         )
@@ -183,15 +184,18 @@ class Storage:
         helper_functions.debug_print(f"PUSH FLOW DIRECT: Started for {self.name}")
         while True:
             # Get item from entry
-            helper_functions.debug_print(f"PUSH FLOW: {self.name} waiting for item in entry...")
+            if helper_functions.DEBUG:
+                helper_functions.debug_print(f"PUSH FLOW: {self.name} waiting for item in entry...")
             item = yield self.entry.get()
-            helper_functions.debug_print(f"PUSH FLOW: {self.name} got item {item.ID}")
+            item_type_name = type(item).__name__
+            if helper_functions.DEBUG:
+                helper_functions.debug_print(f"PUSH FLOW: {self.name} got item {item.ID}")
 
             # LOG: Item leaves entry buffer
-            SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
+            helper_functions.add_to_eventlog_v3(
                 case_id=item.caseID,
                 object_id=item.ID,
-                object_type=type(item).__name__,
+                object_type=item_type_name,
                 activity="buffer",
                 activity_state="exit",
                 resource_id=self.name,
@@ -203,19 +207,19 @@ class Storage:
             # Minimal handling time
             yield self.env.timeout(self.handling_time)
 
-            # Advance routing plan to next station if item has routing
-            if hasattr(item, "advance_route"):
-                item.advance_route()
+            # Advance routing plan to next station (no-op for groups and components)
+            item.advance_route()
 
             # Put directly in outbuf_to_next (skip station_storage)
             yield self.outbuf_to_next.put(item)
-            helper_functions.debug_print(f"PUSH FLOW: {self.name} put item {item.ID} in outbuf_to_next")
+            if helper_functions.DEBUG:
+                helper_functions.debug_print(f"PUSH FLOW: {self.name} put item {item.ID} in outbuf_to_next")
 
             # LOG: Item enters output buffer
-            SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
+            helper_functions.add_to_eventlog_v3(
                 case_id=item.caseID,
                 object_id=item.ID,
-                object_type=type(item).__name__,
+                object_type=item_type_name,
                 activity="buffer",
                 activity_state="enter",
                 resource_id=self.name,
@@ -238,7 +242,7 @@ class Storage:
         """
         while True:
             #  DEBUG for b-01
-            if self.name == "b-01_buffer_01":
+            if helper_functions.DEBUG and self.name == "b-01_buffer_01":
                 helper_functions.debug_print(
                     f"b-01 put_into_storage: Waiting for items in entry, "
                     f"entry has {len(self.entry.items)} items"
@@ -246,18 +250,19 @@ class Storage:
 
             # Get item from entry
             item = yield self.entry.get()
+            item_type_name = type(item).__name__
 
             # DEBUG
-            if self.name == "b-01_buffer_01":
+            if helper_functions.DEBUG and self.name == "b-01_buffer_01":
                 helper_functions.debug_print(
                     f"b-01: Got {item.ID} from entry, moving to station_storage"
                 )
 
             # LOG: ITEM LEAVES INCOMING BUFFER OF STORAGE (-> gets stored)
-            SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
+            helper_functions.add_to_eventlog_v3(
                 case_id=item.caseID,
                 object_id=item.ID,
-                object_type=type(item).__name__,
+                object_type=item_type_name,
                 activity="buffer",
                 activity_state="exit",
                 resource_id=self.name,
@@ -268,7 +273,7 @@ class Storage:
 
             yield self.env.timeout(self.handling_time)
             # Add debug and exception handling
-            if self.name == "b-01_buffer_01":
+            if helper_functions.DEBUG and self.name == "b-01_buffer_01":
                 helper_functions.debug_print(
                     f"b-01: About to put {item.ID} in station_storage, "
                     f"capacity={self.station_storage.capacity}, "
@@ -278,7 +283,7 @@ class Storage:
             try:
                 yield self.station_storage.put(item)
 
-                if self.name == "b-01_buffer_01":
+                if helper_functions.DEBUG and self.name == "b-01_buffer_01":
                     helper_functions.debug_print(
                         f"b-01: Successfully put {item.ID} in station_storage"
                     )
@@ -289,10 +294,10 @@ class Storage:
                 raise
 
             # LOG: COMPONENT STORED IN MAIN AREA OF STORAGE
-            SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
+            helper_functions.add_to_eventlog_v3(
                 case_id=item.caseID,
                 object_id=item.ID,
-                object_type=type(item).__name__,
+                object_type=item_type_name,
                 activity="storage",
                 activity_state="enter",  # Item is now in storage
                 resource_id=self.name,
@@ -305,133 +310,75 @@ class Storage:
         """This method represents a continuous process of moving items from the
         main storage area to its outbuf_to_next.
 
-        In push mode: actively checks for items and pushes them
-        In pull mode: waits for items as before
+        Only runs in pull mode (waits for items); in push mode intermediate
+        storages use push_flow_direct() instead.
         """
         # DEBUG
-        if self.name == "b-01_buffer_01":
+        if helper_functions.DEBUG and self.name == "b-01_buffer_01":
             helper_functions.debug_print(
                 f"b-01 get_from_storage process started at {self.env.now}"
             )
 
         while True:
-            # In push mode, actively check for items
-            if getattr(SimulationConfig, "material_flow_mode", "pull") == "push":
-                # Check if there are items to push
-                if (
-                    len(self.station_storage.items) > 0
-                    and len(self.outbuf_to_next.items) < self.exit_capacity
-                ):
-                    item = yield self.station_storage.get()
-
-                    # LOG: COMPONENT PULLED FROM INVENTORY
-                    SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
-                        case_id=item.caseID,
-                        object_id=item.ID,
-                        object_type=type(item).__name__,
-                        activity="storage",
-                        activity_state="exit",
-                        resource_id=self.name,
-                        resource_location="inventory",
-                        timestamp=self.env.now,
-                        related_objects=None,
-                    )
+            # DEBUG before get
+            if helper_functions.DEBUG and self.name == "b-01_buffer_01":
+                helper_functions.debug_print(
+                    f"b-01 get_from_storage: About to get from storage at {self.env.now}, "
+                    f"storage has {len(self.station_storage.items)} items, "
+                    f"outbuf has {len(self.outbuf_to_next.items)}/{self.exit_capacity}"
+                )
 
-                    yield self.env.timeout(self.handling_time)
-
-                    # Advance routing plan to next station if item has routing
-                    if hasattr(item, "advance_route"):
-                        item.advance_route()
-
-                    yield self.outbuf_to_next.put(item)
-
-                    # COMPONENT PLACED IN BUFFER (for further disassembly)
-                    SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
-                        case_id=item.caseID,
-                        object_id=item.ID,
-                        object_type=type(item).__name__,
-                        activity="buffer",
-                        activity_state="enter",
-                        resource_id=self.name,
-                        resource_location="outbuf_to_next",
-                        timestamp=self.env.now,
-                        related_objects=None,
-                    )
+            item = yield self.station_storage.get()
+            item_type_name = type(item).__name__
 
-                    # order outbuf_to_next to pick up component if end of line
-                    if self in self.simulation.ends_of_line:
-                        self.env.process(
-                            functions.ordering(
-                                self.simulation.outgoing_storage,
-                                self.simulation,
-                                "outbuf_to_next",
-                            )
-                        )
-                else:
-                    # No items to push or output buffer full, wait a bit
-                    yield self.env.timeout(SimulationConfig.push_check_frequency)
-            else:
-                # Pull mode - original behavior
+            # DEBUG after get
+            if helper_functions.DEBUG and self.name == "b-01_buffer_01":
+                helper_functions.debug_print(
+                    f"b-01 get_from_storage: Got {item.ID}, moving to outbuf_to_next"
+                )
 
-                # DEBUG before get
-                if self.name == "b-01_buffer_01":
-                    helper_functions.debug_print(
-                        f"b-01 get_from_storage: About to get from storage at {self.env.now}, "
-                        f"storage has {len(self.station_storage.items)} items, "
-                        f"outbuf has {len(self.outbuf_to_next.items)}/{self.exit_capacity}"
-                    )
+            # LOG: COMPONENT PULLED FROM INVENTORY
+            helper_functions.add_to_eventlog_v3(
+                case_id=item.caseID,
+                object_id=item.ID,
+                object_type=item_type_name,
+                activity="storage",
+                activity_state="exit",
+                resource_id=self.name,
+                resource_location="inventory",
+                timestamp=self.env.now,
+                related_objects=None,
+            )
 
-                item = yield self.station_storage.get()
+            yield self.env.timeout(self.handling_time)
 
-                # DEBUG after get
-                if self.name == "b-01_buffer_01":
-                    helper_functions.debug_print(
-                        f"b-01 get_from_storage: Got {item.ID}, moving to outbuf_to_next"
-                    )
+            # Advance routing plan to next station (no-op for groups and components)
+            item.advance_route()
 
-                # LOG: COMPONENT PULLED FROM INVENTORY
-                SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
-                    case_id=item.caseID,
-                    object_id=item.ID,
-                    object_type=type(item).__name__,
-                    activity="storage",
-                    activity_state="exit",
-                    resource_id=self.name,
-                    resource_location="inventory",
-                    timestamp=self.env.now,
-                    related_objects=None,
-                )
+            yield self.outbuf_to_next.put(item)
 
-                yield self.env.timeout(self.handling_time)
-
-                # Advance routing plan to next station if item has routing
-                if hasattr(item, "advance_route"):
-                    item.advance_route()
-
-                yield self.outbuf_to_next.put(item)
-
-                # COMPONENT PLACED IN BUFFER (for further disassembly)
-                SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
-                    case_id=item.caseID,
-                    object_id=item.ID,
-                    object_type=type(item).__name__,
-                    activity="buffer",
-                    activity_state="enter",
-                    resource_id=self.name,
-                    resource_location="outbuf_to_next",
-                    timestamp=self.env.now,
-                    related_objects=None,
-                )
+            # COMPONENT PLACED IN BUFFER (for further disassembly)
+            helper_functions.add_to_eventlog_v3(
+                case_id=item.caseID,
+                object_id=item.ID,
+                object_type=item_type_name,
+                activity="buffer",
+                activity_state="enter",
+                resource_id=self.name,
+                resource_location="outbuf_to_next",
+                timestamp=self.env.now,
+                related_objects=None,
+            )
 
-                # order outbuf_to_next to pick up component if end of line
-                if self in self.simulation.ends_of_line:
-                    self.env.process(
-                        functions.ordering(
-                            self.simulation.outgoing_storage,
-                            self.simulation,
-                            "outbuf_to_next",
-                        )
+            # order outbuf_to_next to pick up component if end of line
+            if self.is_end_of_line:
+                self.env.process(
+                    functions.ordering(
+                        self.simulation.outgoing_storage,
+                        self.simulation,
+                        "outbuf_to_next",
                     )
+                )
 
     def incoming_storage_process(self):
         """Special process for incoming storage - goes directly from entry to output buffer."""
@@ -443,9 +390,10 @@ class Storage:
         while True:
             # Get product from entry (where Source puts them)
             item = yield self.entry.get()
+            item_type_name = type(item).__name__
 
             # Only log first few items
-            if self.env.now < 500:
+            if helper_functions.DEBUG and self.env.now < 500:
                 helper_functions.debug_print(
                     f"incoming_storage: Processing {item.ID} at {self.env.now}"
                 )
@@ -457,10 +405,10 @@ class Storage:
             yield self.outbuf_to_next.put(item)
 
             # Log ready for dispatch to shop floor
-            SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
+            helper_functions.add_to_eventlog_v3(
                 case_id=item.caseID,
                 object_id=item.ID,
-                object_type=type(item).__name__,
+                object_type=item_type_name,
                 activity="storage",
                 activity_state="enter",
                 resource_id="incoming_storage",
@@ -480,10 +428,11 @@ class Storage:
             output_item = yield self.entry.get()
 
             # Debug log item exit
-            helper_functions.debug_print(
-                f"Item {output_item.ID} type={output_item.type} exiting system "
-                f"through outgoing storage (condition={output_item.condition:.2f})"
-            )
+            if helper_functions.DEBUG:
+                helper_functions.debug_print(
+                    f"Item {output_item.ID} type={output_item.type} exiting system "
+                    f"through outgoing storage (condition={output_item.condition:.2f})"
+                )
 
             # Determine object type for clear tracking
             object_category = type(output_item).__name__  # product, component, or group
@@ -494,10 +443,10 @@ class Storage:
                 component_name = output_item.type.split("_")[-1]
 
             # LOG: ITEM LEAVES INCOMING BUFFER (-> Placed into outgoing storage)
-            SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
+            helper_functions.add_to_eventlog_v3(
                 case_id=output_item.caseID,
                 object_id=output_item.ID,
-                object_type=type(output_item).__name__,
+                object_type=object_category,
                 activity="buffer",
                 activity_state="exit",
                 resource_id=self.name,
@@ -513,30 +462,12 @@ class Storage:
             # WORKAROUND: Mark products as done when they exit through outgoing storage
             # This handles cases where products have unprocessed components that no station can handle
             if object_category == "product":
-                # Check if product is not already marked as done
-                done_status = (
-                    SimulationConfig.log_disassembly.loc[
-                        SimulationConfig.log_disassembly["ID"] == output_item.ID, "done"
-                    ].iloc[0]
-                    if len(
-                        SimulationConfig.log_disassembly[
-                            SimulationConfig.log_disassembly["ID"] == output_item.ID
-                        ]
-                    )
-                    > 0
-                    else False
-                )
-
-                # ALWAYS calculate times when product exits (remove the if not done_status check)
-                # Convert events to DataFrame
-                if SimulationConfig.events_list:
-                    eventlog_df = pd.DataFrame(SimulationConfig.events_list)
-                else:
-                    eventlog_df = SimulationConfig.eventlog
-
-                # Use the simple calculation method
-                time_components = helper_functions.calculate_time_components_simple(
-                    output_item.caseID, eventlog_df, self.simulation
+                # ALWAYS calculate times when product exits, whether or not it is already done
+                # Calculate the times from the events of this case only
+                helper_functions.flush_eventlog()
+                time_components = helper_functions.calculate_case_time_components(
+                    SimulationConfig.events_by_case.get(output_item.caseID, []),
+                    self.simulation,
                 )
 
                 # Update the log
@@ -556,10 +487,10 @@ class Storage:
                 )
 
             # LOG: COMPONENT LEAVES OUTGOING STORAGE / SYSTEM (= final destination in the system)
-            SimulationConfig.eventlog = helper_functions.add_to_eventlog_v3(
+            helper_functions.add_to_eventlog_v3(
                 case_id=output_item.caseID,
                 object_id=output_item.ID,
-                object_type=type(output_item).__name__,
+                object_type=object_category,
                 activity="system",
                 activity_state="exit",
                 resource_id=self.name,
@@ -580,28 +511,22 @@ class Storage:
                     helper_functions.list_components(output_item.content["structure"])
                 )
 
-            # Create new row with all required columns
-            new_row = pd.DataFrame(
-                [
-                    {
-                        "caseID": output_item.caseID,
-                        "objectID": output_item.ID,
-                        "object_type": object_category,
-                        "object_name": output_item.type,
-                        "delivery_time": datetime.fromtimestamp(
-                            output_item.delivery_time * 60
-                            + SimulationConfig.start_date.timestamp()
-                        ).strftime("%Y-%m-%dT%H:%M:%S"),
-                        "output_time": datetime.fromtimestamp(
-                            self.env.now * 60 + SimulationConfig.start_date.timestamp()
-                        ).strftime("%Y-%m-%dT%H:%M:%S"),
-                        "condition": round(output_item.condition, 2),
-                        "content": content,
-                    }
-                ]
-            )
-
-            # Add to global log
-            SimulationConfig.output_table = pd.concat(
-                [SimulationConfig.output_table, new_row], ignore_index=True
+            # Add new row with all required columns to global log (converted to the
+            # output_table DataFrame once at export)
+            SimulationConfig.output_table_list.append(
+                {
+                    "caseID": output_item.caseID,
+                    "objectID": output_item.ID,
+                    "object_type": object_category,
+                    "object_name": output_item.type,
+                    "delivery_time": datetime.fromtimestamp(
+                        output_item.delivery_time * 60
+                        + SimulationConfig.start_date.timestamp()
+                    ).strftime("%Y-%m-%dT%H:%M:%S"),
+                    "output_time": datetime.fromtimestamp(
+                        self.env.now * 60 + SimulationConfig.start_date.timestamp()
+                    ).strftime("%Y-%m-%dT%H:%M:%S"),
+                    "condition": round(output_item.condition, 2),
+                    "content": content,
+                }
             )
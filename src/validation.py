@@ -17,8 +17,35 @@ Raises appropriate errors (FileNotFoundError, ValueError, OSError) if validation
 
 import os
 import json
+import stat
 import pandas as pd
 from src.g import g, SimulationConfig
+import helper_functions
+
+# Parameters every variant definition in a product file has to provide
+_REQUIRED_VARIANT_PARAMS = frozenset(
+    {
+        "type",  # Product type identifier
+        "volume_per_week_min",  # Minimum weekly volume
+        "volume_per_week_mu",  # Mean weekly volume
+        "volume_per_week_max",  # Maximum weekly volume
+        "structure",  # Product structure definition
+    }
+)
+
+
+def _iter_json_files(root):
+    """Yield the paths of all JSON files below root (including subdirectories).
+
+    Uses os.scandir so the file type known from the directory listing is reused
+    instead of an additional stat call per entry as done by os.walk.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_json_files(entry.path)
+            elif entry.name.endswith(".json"):
+                yield entry.path
 
 
 def validate_inputs():
@@ -41,57 +68,58 @@ def validate_inputs():
         bool: True if all validations pass
     """
 
-    # Check required config files exist
     config_dir = os.path.join(SimulationConfig.file_path, "config")
-    required_files = [
-        os.path.join(config_dir, "default_config.json"),
-        os.path.join(config_dir, "runtime_config.json"),
-    ]
-
-    for file_path in required_files:
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(
-                f"Required configuration file not found: {file_path}"
-            )
-
-    # Check base directory exists
-    if not os.path.exists(g.file_path):
-        raise FileNotFoundError(f"Base path not found: {g.file_path}")
-
-    # Check factory structure directory exists
     structure_path = os.path.join(g.file_path, g.structure_path)
-    if not os.path.exists(structure_path):
-        raise FileNotFoundError(f"Structure path not found: {structure_path}")
-
-    # Check product definitions directory exists
     product_range_path = os.path.join(
         SimulationConfig.file_path, "config", "product_config"
     )
-    if not os.path.exists(product_range_path):
-        raise FileNotFoundError(f"Product range path not found: {product_range_path}")
-
-    # Verify structure file exists and has correct format
     structure_file = os.path.join(structure_path, SimulationConfig.structure_file)
-    if not os.path.exists(structure_file):
-        raise FileNotFoundError(f"Structure file not found: {structure_file}")
+
+    # Check all required files and directories in one pass (one stat per path)
+    # and report every missing one at once
+    required_paths = [
+        (
+            "Required configuration file",
+            os.path.join(config_dir, "default_config.json"),
+            False,
+        ),
+        (
+            "Required configuration file",
+            os.path.join(config_dir, "runtime_config.json"),
+            False,
+        ),
+        ("Base path", g.file_path, True),
+        ("Structure path", structure_path, True),
+        ("Product range path", product_range_path, True),
+        ("Structure file", structure_file, False),
+    ]
+    missing = []
+    for description, path, is_dir in required_paths:
+        try:
+            mode = os.stat(path).st_mode
+        except OSError:
+            missing.append(f"{description} not found: {path}")
+            continue
+        if is_dir and not stat.S_ISDIR(mode):
+            missing.append(f"{description} is not a directory: {path}")
+        elif not is_dir and stat.S_ISDIR(mode):
+            missing.append(f"{description} is a directory: {path}")
+
+    if missing:
+        raise FileNotFoundError("\n".join(missing))
 
     # Attempt to load and validate structure file content
     try:
-        with open(structure_file, "r") as f:
-            structure_data = json.load(f)
-            # Check for required top-level key
-            if "factory" not in structure_data:
-                raise ValueError("Invalid structure file format: missing 'factory' key")
+        structure_data = helper_functions.load_json_cached(structure_file)
+        # Check for required top-level key
+        if "factory" not in structure_data:
+            raise ValueError("Invalid structure file format: missing 'factory' key")
     except json.JSONDecodeError:
         raise ValueError(f"Invalid JSON format in structure file: {structure_file}")
 
     # Product Files Validation
     # Get list of all JSON files in product range directory (including subdirectories)
-    product_files = []
-    for root, dirs, files in os.walk(product_range_path):
-        for file in files:
-            if file.endswith(".json"):
-                product_files.append(os.path.join(root, file))
+    product_files = list(_iter_json_files(product_range_path))
 
     if not product_files:
         raise FileNotFoundError(
@@ -101,28 +129,19 @@ def validate_inputs():
     # Validate each product file
     for product_file_path in product_files:
         try:
-            with open(product_file_path, "r") as f:
-                product_data = json.load(f)
-                # Check for required top-level structure
-                if "variant" not in product_data:
-                    raise ValueError(
-                        f"Invalid product file format in {product_file_path}: missing 'variant' key"
-                    )
-
-                # Check for all required parameters in variant definition
-                required_params = [
-                    "type",  # Product type identifier
-                    "volume_per_week_min",  # Minimum weekly volume
-                    "volume_per_week_mu",  # Mean weekly volume
-                    "volume_per_week_max",  # Maximum weekly volume
-                    "structure",  # Product structure definition
-                ]
-
-                for param in required_params:
-                    if param not in product_data["variant"]:
-                        raise ValueError(
-                            f"Missing required parameter '{param}' in {product_file_path}"
-                        )
+            product_data = helper_functions.load_json_cached(product_file_path)
+            # Check for required top-level structure
+            if "variant" not in product_data:
+                raise ValueError(
+                    f"Invalid product file format in {product_file_path}: missing 'variant' key"
+                )
+
+            # Check for all required parameters in variant definition
+            missing = _REQUIRED_VARIANT_PARAMS.difference(product_data["variant"])
+            if missing:
+                raise ValueError(
+                    f"Missing required parameters {sorted(missing)} in {product_file_path}"
+                )
         except json.JSONDecodeError:
             raise ValueError(f"Invalid JSON format in product file: {product_file_path}")
 
@@ -23,6 +23,42 @@ import functions
 import helper_functions
 from src.g import *
 
+# Driving times by (start, end, speed), valid for the distance matrix object
+# stored in _driving_time_matrix, see _get_driving_time()
+_driving_time_cache = {}
+_driving_time_matrix = None
+
+
+def _get_driving_time(start_location: str, end_location: str, speed: float) -> float:
+    """Memoised helper_functions.get_driving_time() for the current distance matrix.
+
+    The same routes are driven over and over, so each (start, end, speed) is
+    looked up in the distance matrix only once. The cache is reset when a new
+    distance matrix is loaded (e.g. for the next experiment).
+
+    Args:
+        start_location (str): name of the start location
+        end_location (str): name of the end location
+        speed (float): speed of the vehicle
+
+    Returns:
+        float: driving time between the two locations in time units
+    """
+    global _driving_time_matrix
+    distance_matrix = SimulationConfig.distance_matrix
+    if distance_matrix is not _driving_time_matrix:
+        _driving_time_cache.clear()
+        _driving_time_matrix = distance_matrix
+
+    key = (start_location, end_location, speed)
+    driving_time = _driving_time_cache.get(key)
+    if driving_time is None:
+        driving_time = helper_functions.get_driving_time(
+            start_location, end_location, speed, distance_matrix
+        )
+        _driving_time_cache[key] = driving_time
+    return driving_time
+
 
 class Vehicle(simpy.PreemptiveResource):
     """This class represents a transport vehicle and extends simpy's PreemptiveResource class.
@@ -33,7 +69,7 @@ class Vehicle(simpy.PreemptiveResource):
         env (simpy.Environment): The simulation environment.
         name (str): The name of the vehicle.
         speed (float): The speed of the vehicle in m/min
-        load (simpy.FilterStore): A storage for the items loaded on the vehicle.
+        load (simpy.Store): A storage for the items loaded on the vehicle.
         transport_units_used (int): The amount of transport units currently used by the load on the vehicle.
         load_capacity (int): The maximum load capacity of the vehicle in terms of transport units.
         location (str): The current location of the vehicle.
@@ -42,7 +78,6 @@ class Vehicle(simpy.PreemptiveResource):
 
     Methods:
         create_return(*args, **kwargs): A method to return the vehicle if it is requested.
-        release(request): A method to release the vehicle.
         load_item(item): A method to load an item onto the vehicle.
         unload_item(): A method to unload an item from the vehicle.
         drive(end_location): A method to drive the vehicle to a specific location.
@@ -63,7 +98,8 @@ class Vehicle(simpy.PreemptiveResource):
         self.name = name
         self.speed = speed
         # capacity is infinite (capacity is limited in terms of transport units, not count of items)
-        self.load = simpy.FilterStore(env, capacity=float("inf"))
+        # plain Store, items are only ever unloaded first in first out
+        self.load = simpy.Store(env, capacity=float("inf"))
         self.transport_units_used = 0
         self.load_capacity = load_capacity
         self.location = location
@@ -86,15 +122,6 @@ class Vehicle(simpy.PreemptiveResource):
         req.vehicle = self
         return req
 
-    def release(self: object, request: object) -> None:
-        """release the vehicle
-
-        Args:
-            self (object): A reference to the vehicle instance.
-            request (object): The request for the vehicle resource.
-        """
-        super().release(request)
-
     def load_item(self: object, item: object) -> None:
         """Loads an item onto the vehicle and updates the transport_units_used attribute
         according the transport_units used by the item.
@@ -133,14 +160,12 @@ class Vehicle(simpy.PreemptiveResource):
 
     def drive(self: object, end_location: str) -> None:
         """Drives the vehicle to a specified location."""
+        start_location = self.location
         # Check, if vehicle is not already at end location
-        if self.location != end_location:
+        if start_location != end_location:
             # calculate driving time
-            base_driving_time = helper_functions.get_driving_time(
-                self.location,
-                end_location,
-                self.speed,
-                SimulationConfig.distance_matrix,
+            base_driving_time = _get_driving_time(
+                start_location, end_location, self.speed
             )
 
             # Apply variation based on behavior mode